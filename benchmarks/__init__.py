@@ -0,0 +1,3 @@
+from typing import Any, Callable
+
+Bench = Callable[..., Any]
@@ -0,0 +1,34 @@
+from typing import Any, Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks import Bench, regression
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("justobjects performance")
+    group.addoption(
+        "--perf-threshold",
+        type=float,
+        default=regression.DEFAULT_THRESHOLD,
+        help="maximum slowdown in percent allowed against the performance baseline",
+    )
+    group.addoption(
+        "--perf-update",
+        action="store_true",
+        default=False,
+        help="record the measured scenarios as the new performance baseline",
+    )
+
+
+@pytest.fixture
+def bench(benchmark: BenchmarkFixture) -> Bench:
+    """Runs a benchmark, scaling down the number of rounds for large payloads"""
+
+    def run(fn: Callable, *args: Any, size: int = 1) -> Any:
+        rounds = max(1, min(50, 10_000 // max(size, 1)))
+        warmup_rounds = 1 if rounds > 1 else 0
+        return benchmark.pedantic(fn, args=args, rounds=rounds, warmup_rounds=warmup_rounds)
+
+    return run
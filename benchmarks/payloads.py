@@ -0,0 +1,48 @@
+from typing import Any, Dict, List
+
+SIZES = [1, 100, 10_000, 100_000]
+
+
+def role(i: int) -> Dict[str, Any]:
+    return {"name": f"Character {i}", "race": "human"}
+
+
+def actor(i: int) -> Dict[str, Any]:
+    return {
+        "name": f"Actor {i}",
+        "sex": "female" if i % 2 else "male",
+        "age": 18 + i % 60,
+        "height": 1.5 + (i % 50) / 100,
+        "married": bool(i % 3),
+        "role": role(i),
+    }
+
+
+def movie(i: int) -> Dict[str, Any]:
+    return {"main": actor(i), "title": f"Movie number {i % 1000}", "characters": i % 500}
+
+
+def actors(size: int) -> List[Dict[str, Any]]:
+    return [actor(i) for i in range(size)]
+
+
+def manager(size: int) -> Dict[str, Any]:
+    return {
+        "actors": actors(size),
+        "movies": [movie(i) for i in range(size)],
+        "personal": {f"actor-{i}": actor(i) for i in range(size)},
+    }
+
+
+def role_manager(size: int) -> Dict[str, Any]:
+    return {
+        "roles": [role(i) for i in range(size)],
+        "allowed": [role(i) for i in range(size)],
+        "people": actor(size),
+        "names": "Steve",
+        "requires": "A working bubble",
+    }
+
+
+def csv_cells(size: int) -> List[str]:
+    return [str(i) for i in range(size)]
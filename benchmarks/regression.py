@@ -0,0 +1,133 @@
+"""End to end performance scenarios compared against a committed baseline
+
+Scenario timings are divided by the timing of a fixed calibration loop so that the stored
+baseline is a relative cost that can be compared across machines. Every cost is the median of
+several samples, each sample repeats the workload for at least `MIN_SAMPLE_TIME` seconds so that
+short scenarios are not dominated by timer and scheduling noise.
+"""
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import justobjects as jo
+from benchmarks import payloads
+from tests.models import Actor, Manager
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD = 25.0
+SIZE = 2_000
+SAMPLES = 7
+MIN_SAMPLE_TIME = 0.2
+
+Scenario = Callable[[], Callable[[], Any]]
+
+
+def _loops(fn: Callable[[], Any], min_time: float) -> int:
+    """Returns how often fn is called per sample to run for at least min_time seconds"""
+
+    loops = 1
+    while _sample(fn, loops) * loops < min_time:
+        loops *= 2
+    return loops
+
+
+def _sample(fn: Callable[[], Any], loops: int) -> float:
+    """Returns the mean time of a call to fn over loops calls in seconds"""
+
+    start = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - start) / loops
+
+
+def _calibration_loop() -> int:
+    total = 0
+    values: Dict[str, int] = {}
+    for i in range(200_000):
+        key = str(i % 1000)
+        values[key] = values.get(key, 0) + i
+        total += len(key)
+    return total
+
+
+def bulk_from_dict() -> Callable[[], Any]:
+    data = payloads.actors(SIZE)
+    return lambda: [Actor(**item) for item in data]
+
+
+def as_dict_aggregate() -> Callable[[], Any]:
+    manager = Manager(**payloads.manager(SIZE // 10))
+    return lambda: jo.as_dict(manager)
+
+
+def validate_invalid_payload() -> Callable[[], Any]:
+    data = payloads.manager(SIZE // 10)
+    for actor in data["actors"]:
+        actor["age"] = str(actor["age"])
+        actor.pop("name")
+
+    def run() -> None:
+        try:
+            jo.validate(Manager, data)
+        except jo.ValidationException as e:
+            assert len(e.errors) >= SIZE // 5
+
+    return run
+
+
+def coerce_csv_rows() -> Callable[[], Any]:
+    columns = [
+        jo.StringType(),
+        jo.StringType(),
+        jo.IntegerType(),
+        jo.NumericType(),
+        jo.BooleanType(),
+    ]
+    rows = [
+        [f"Actor {i}", "female", str(18 + i % 60), str(1.5 + i % 50 / 100), "yes"]
+        for i in range(SIZE)
+    ]
+    return lambda: [[jo.cast(cell, sc) for cell, sc in zip(row, columns)] for row in rows]
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "bulk_from_dict": bulk_from_dict,
+    "as_dict_aggregate": as_dict_aggregate,
+    "validate_invalid_payload": validate_invalid_payload,
+    "coerce_csv_rows": coerce_csv_rows,
+}
+
+
+def measure(name: str, samples: int = SAMPLES, min_time: float = MIN_SAMPLE_TIME) -> float:
+    """Measures a scenario relative to the calibration loop
+
+    Samples of the scenario and of the calibration loop alternate, the result is the median of
+    their ratios so that changes of the machine speed during a run cancel out.
+
+    Args:
+        name: name of the scenario
+        samples: number of samples the median is taken from
+        min_time: minimum duration of a sample in seconds
+    """
+
+    scenario = SCENARIOS[name]()
+    scenario_loops = _loops(scenario, min_time)
+    calibration_loops = _loops(_calibration_loop, min_time)
+    ratios: List[float] = []
+    for _ in range(samples):
+        unit = _sample(_calibration_loop, calibration_loops)
+        ratios.append(_sample(scenario, scenario_loops) / unit)
+    return statistics.median(ratios)
+
+
+def load_baseline() -> Dict[str, float]:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())["scenarios"]
+
+
+def save_baseline(results: Dict[str, float]) -> None:
+    content = {"unit": "calibration loop", "scenarios": results}
+    BASELINE_FILE.write_text(json.dumps(content, indent=2, sort_keys=True) + "\n")
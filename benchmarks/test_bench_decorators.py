@@ -0,0 +1,47 @@
+from typing import Dict, List
+
+import pytest
+
+import justobjects as jo
+from benchmarks import Bench, payloads
+from tests.models import Actor, Manager, Role, RoleManager
+
+
+def define_models(lazy: bool) -> None:
+    @jo.data(typed=True, lazy=lazy)
+    class Crew:
+        name: str
+        lead: Actor
+        members: List[Actor]
+        roles: Dict[str, Role]
+        size: int = 1
+
+    @jo.data(lazy=lazy)
+    class Production:
+        crew = jo.ref(Crew, required=True)
+        title = jo.string(min_length=1, max_length=64, required=True)
+        budget = jo.numeric(minimum=0)
+        cast = jo.array(item=Actor, unique_items=True)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_define_models(bench: Bench, lazy: bool) -> None:
+    bench(define_models, lazy)
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_construct_actors(bench: Bench, size: int) -> None:
+    data = payloads.actors(size)
+    bench(lambda: [Actor(**item) for item in data], size=size)
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_construct_manager(bench: Bench, size: int) -> None:
+    data = payloads.manager(size)
+    bench(lambda: Manager(**data), size=size)
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_construct_role_manager(bench: Bench, size: int) -> None:
+    data = payloads.role_manager(size)
+    bench(lambda: RoleManager(**data), size=size)
@@ -0,0 +1,43 @@
+from typing import Dict, List, Optional
+
+import pytest
+
+import justobjects as jo
+from benchmarks import Bench, payloads
+from tests.models import Actor, Manager, Movie, Role, RoleManager
+
+
+@pytest.mark.parametrize("model", [Role, Actor, Movie, Manager, RoleManager])
+def test_show_model_schema(bench: Bench, model: type) -> None:
+    bench(jo.show_schema, model)
+
+
+@pytest.mark.parametrize("alias", [List[Actor], Dict[str, Movie], Optional[Manager]])
+def test_show_generic_schema(bench: Bench, alias: type) -> None:
+    bench(jo.show_schema, alias)
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_validate_valid_dicts(bench: Bench, size: int) -> None:
+    data = payloads.actors(size)
+    bench(lambda: [jo.validate(Actor, item) for item in data], size=size)
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_validate_invalid_dicts(bench: Bench, size: int) -> None:
+    data = [{"name": i, "sex": None, "age": "old"} for i in range(size)]
+
+    def validate_all() -> None:
+        for item in data:
+            try:
+                jo.validate(Actor, item)
+            except jo.ValidationException:
+                pass
+
+    bench(validate_all, size=size)
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_validate_aggregate(bench: Bench, size: int) -> None:
+    manager = Manager(**payloads.manager(size))
+    bench(jo.validate, manager, size=size)
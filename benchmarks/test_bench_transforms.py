@@ -0,0 +1,17 @@
+import pytest
+
+import justobjects as jo
+from benchmarks import Bench, payloads
+from tests.models import Actor, Manager
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_as_dict_actors(bench: Bench, size: int) -> None:
+    actors = [Actor(**item) for item in payloads.actors(size)]
+    bench(jo.as_dict, actors, size=size)
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_as_dict_manager(bench: Bench, size: int) -> None:
+    manager = Manager(**payloads.manager(size))
+    bench(jo.as_dict, manager, size=size)
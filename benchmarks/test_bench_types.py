@@ -0,0 +1,25 @@
+import pytest
+
+import justobjects as jo
+from benchmarks import Bench, payloads
+
+SCHEMAS = [
+    jo.IntegerType(minimum=0),
+    jo.NumericType(minimum=0),
+    jo.StringType(maxLength=32),
+    jo.BooleanType(),
+]
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+@pytest.mark.parametrize("schema", SCHEMAS, ids=lambda s: type(s).__name__)
+def test_cast_cells(bench: Bench, schema: jo.BasicType, size: int) -> None:
+    cells = ["1" if isinstance(schema, jo.BooleanType) else v for v in payloads.csv_cells(size)]
+    bench(lambda: [jo.cast(cell, schema) for cell in cells], size=size)
+
+
+@pytest.mark.parametrize("size", payloads.SIZES)
+def test_cast_array(bench: Bench, size: int) -> None:
+    schema = jo.ArrayType(items=jo.IntegerType(), maxItems=None)
+    cells = payloads.csv_cells(size)
+    bench(jo.cast, cells, schema, size=size)
@@ -0,0 +1,33 @@
+from typing import Dict
+
+import pytest
+
+from benchmarks import regression
+
+
+@pytest.fixture(scope="module")
+def measured() -> Dict[str, float]:
+    return {}
+
+
+@pytest.mark.parametrize("scenario", list(regression.SCENARIOS))
+def test_scenario_regression(
+    request: pytest.FixtureRequest, measured: Dict[str, float], scenario: str
+) -> None:
+    update = request.config.getoption("--perf-update")
+    threshold = request.config.getoption("--perf-threshold")
+
+    cost = regression.measure(scenario)
+    measured[scenario] = cost
+    if update:
+        regression.save_baseline({**regression.load_baseline(), **measured})
+        return
+
+    baseline = regression.load_baseline().get(scenario)
+    if baseline is None:
+        pytest.skip(f"no baseline recorded for '{scenario}', run with --perf-update")
+    limit = baseline * (1 + threshold / 100)
+    assert cost <= limit, (
+        f"'{scenario}' is {(cost / baseline - 1) * 100:.1f}% slower than the baseline "
+        f"({cost:.2f} > {baseline:.2f} calibration units)"
+    )
@@ -1,5 +1,6 @@
 from pkg_resources import get_distribution
 
+from justobjects import instrumentation, profiling
 from justobjects.decorators import (
     all_of,
     any_of,
@@ -13,6 +14,8 @@ from justobjects.decorators import (
     ref,
     string,
 )
+from justobjects.ingest import RowError, coerce, iter_csv
+from justobjects.prefork import warmup
 from justobjects.schemas import show_schema, validate
 from justobjects.transforms import as_dict
 from justobjects.types import (
@@ -39,8 +42,14 @@ from justobjects.types import (
     UriType,
     UuidType,
     cast,
+    register_converter,
+)
+from justobjects.validation import (
+    Limits,
+    ValidationError,
+    ValidationException,
+    ValidationLimitExceeded,
 )
-from justobjects.validation import ValidationError, ValidationException
 
 VERSION = get_distribution(__name__).version
 
@@ -51,15 +60,21 @@ __all__ = [
     "as_dict",
     "boolean",
     "cast",
+    "coerce",
     "data",
+    "instrumentation",
     "integer",
+    "iter_csv",
     "must_not",
     "numeric",
     "one_of",
+    "profiling",
     "ref",
+    "register_converter",
     "show_schema",
     "string",
     "validate",
+    "warmup",
     "AllOfType",
     "AnyOfType",
     "ArrayType",
@@ -71,6 +86,7 @@ __all__ = [
     "HostnameType",
     "BooleanType",
     "IntegerType",
+    "Limits",
     "Ipv4Type",
     "Ipv6Type",
     "NotType",
@@ -78,11 +94,13 @@ __all__ = [
     "ObjectType",
     "OneOfType",
     "RefType",
+    "RowError",
     "TimeType",
     "UriType",
     "UuidType",
     "StringType",
     "ValidationError",
     "ValidationException",
+    "ValidationLimitExceeded",
     "VERSION",
 ]
@@ -0,0 +1,32 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from justobjects import cache, compiler
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m justobjects")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_parser = commands.add_parser(
+        "compile",
+        help="generate a module with the schemas of the data objects",
+        description=(
+            "Generates a module holding the schemas of the data objects defined in the given "
+            f"modules. Data objects load their schema from a `{cache.COMPILED_MODULE}` module "
+            "found in their package or its parent packages."
+        ),
+    )
+    compile_parser.add_argument("modules", nargs="+", help="modules defining data objects")
+    compile_parser.add_argument("-o", "--output", required=True, help="generated module path")
+    args = parser.parse_args(argv)
+
+    entries = compiler.collect(args.modules)
+    Path(args.output).write_text(compiler.render(entries), encoding="utf-8")
+    print(f"Compiled {len(entries)} data objects to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
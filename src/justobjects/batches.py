@@ -0,0 +1,179 @@
+import multiprocessing
+import os
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from justobjects import binary
+
+__all__ = ["SharedBatch"]
+
+T = TypeVar("T")
+_COUNT = struct.Struct("<Q")
+
+# names of the segments created by this process
+_created: Set[str] = set()
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    """Opens a segment without leaving it to the resource tracker of this process
+
+    Before python 3.13 opening a segment registers it with the resource tracker, which unlinks it
+    once the process exits. Multiprocessing children share the tracker of their parent and keep the
+    registration, removing it would also remove the one of the owner.
+    """
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    segment = shared_memory.SharedMemory(name=name)
+    if (
+        os.name == "posix"
+        and segment.name not in _created
+        and multiprocessing.parent_process() is None
+    ):
+        resource_tracker.unregister(getattr(segment, "_name"), "shared_memory")
+    return segment
+
+
+class SharedBatch(Generic[T]):
+    """Data objects packed in a shared memory segment with their binary encoding
+
+    The segment holds the header of `binary.dumps`, the number of records, a table of record
+    offsets and the encoded records. Other processes attach to the segment by name and decode
+    records on access, without copying the batch. Pickling a batch only transfers the segment
+    name, batches can be passed as is to process pool workers.
+
+    The creating process owns the segment, it is released when the owning batch is closed.
+    Processes attaching to the segment leave it in place when they exit. Requires python 3.8 or
+    later.
+
+    Example:
+        .. code-block:: python
+
+            from concurrent.futures import ProcessPoolExecutor
+            from justobjects.batches import SharedBatch
+
+            def total_age(batch: SharedBatch[Actor]) -> int:
+                return sum(actor.age for actor in batch)
+
+            with SharedBatch.create(Actor, actors) as batch, ProcessPoolExecutor() as pool:
+                print(pool.submit(total_age, batch).result())
+
+    Args:
+        model: data object class of the records
+        segment: shared memory segment holding the batch
+        owner: whether closing the batch also releases the segment
+    """
+
+    def __init__(self, model: Type[T], segment: shared_memory.SharedMemory, owner: bool = False):
+        header = binary.header(model)
+        buf = cast(memoryview, segment.buf)
+        if bytes(buf[: len(header)]) != header:
+            segment.close()
+            raise binary.BinaryFormatError(
+                f"Segment {segment.name} does not hold {model} records"
+            )
+        self.model = model
+        self.segment = segment
+        self.owner = owner
+        self._buf = buf
+        self._count = _COUNT.unpack_from(buf, len(header))[0]
+        self._offsets = len(header) + _COUNT.size
+        self._records = self._offsets + (self._count + 1) * 8
+        self._decode = binary.model_codec(model)[1]
+
+    @classmethod
+    def create(cls, model: Type[T], instances: Iterable[T]) -> "SharedBatch[T]":
+        """Packs data objects into a new shared memory segment"""
+
+        encode = binary.model_codec(model)[0]
+        body = bytearray()
+        offsets = [0]
+        for instance in instances:
+            encode(body, instance)
+            offsets.append(len(body))
+
+        header = binary.header(model) + _COUNT.pack(len(offsets) - 1)
+        table = struct.pack(f"<{len(offsets)}Q", *offsets)
+        size = len(header) + len(table) + len(body)
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        _created.add(segment.name)
+        cast(memoryview, segment.buf)[:size] = header + table + body
+        return cls(model, segment, owner=True)
+
+    @classmethod
+    def attach(cls, model: Type[T], name: str) -> "SharedBatch[T]":
+        """Opens a batch created by another process"""
+
+        return cls(model, _open(name))
+
+    @property
+    def name(self) -> str:
+        return self.segment.name
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, index: int) -> T:
+        start, end = struct.unpack_from("<2Q", self._buf, self._offsets + index * 8)
+        view = self._buf[self._records + start : self._records + end]
+        try:
+            return self._decode(view, 0)[0]  # type: ignore
+        finally:
+            view.release()
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(self._count))]
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError("batch index out of range")
+        return self._record(position)
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(self._count):
+            yield self._record(index)
+
+    def __reduce__(self) -> Any:
+        return SharedBatch.attach, (self.model, self.name)
+
+    def close(self) -> None:
+        """Detaches from the segment, the owning batch also releases it"""
+
+        self.segment.close()
+        if self.owner:
+            _created.discard(self.name)
+            try:
+                self.segment.unlink()
+            except FileNotFoundError:
+                # removed by another process, unlink skips dropping the registration
+                resource_tracker.unregister(getattr(self.segment, "_name"), "shared_memory")
+            self.owner = False
+
+    def __enter__(self) -> "SharedBatch[T]":
+        return self
+
+    def __exit__(self, *args: Optional[Any]) -> None:
+        self.close()
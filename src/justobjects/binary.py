@@ -0,0 +1,308 @@
+import hashlib
+import json
+import struct
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from justobjects import schemas, types
+from justobjects.transforms import as_dict
+
+__all__ = ["BinaryFormatError", "dumps", "loads"]
+
+T = TypeVar("T")
+MAGIC = b"JO\x01"
+HEADER_SIZE = len(MAGIC) + 8
+
+Encoder = Callable[[bytearray, Any], None]
+Decoder = Callable[[bytes, int], Tuple[Any, int]]
+# encoder, decoder and whether the decoded values are exactly the encoded ones
+Codec = Tuple[Encoder, Decoder, bool]
+
+_DOUBLE = struct.Struct("<d")
+_CODECS: "weakref.WeakKeyDictionary[Type, Codec]" = weakref.WeakKeyDictionary()
+_HEADERS: "weakref.WeakKeyDictionary[Type, bytes]" = weakref.WeakKeyDictionary()
+
+
+class BinaryFormatError(ValueError):
+    """Raised when a payload is malformed or was written for another version of a data object"""
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_int(out: bytearray, value: Any) -> None:
+    value = int(value)
+    _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _decode_int(data: bytes, pos: int) -> Tuple[int, int]:
+    value, pos = _read_varint(data, pos)
+    return (value >> 1 if not value & 1 else -((value + 1) >> 1)), pos
+
+
+def _encode_float(out: bytearray, value: Any) -> None:
+    out += _DOUBLE.pack(value)
+
+
+def _decode_float(data: bytes, pos: int) -> Tuple[float, int]:
+    return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+
+
+def _encode_bool(out: bytearray, value: Any) -> None:
+    out.append(1 if value else 0)
+
+
+def _decode_bool(data: bytes, pos: int) -> Tuple[bool, int]:
+    return data[pos] == 1, pos + 1
+
+
+def _encode_str(out: bytearray, value: Any) -> None:
+    raw = value.encode()
+    _write_varint(out, len(raw))
+    out += raw
+
+
+def _decode_str(data: bytes, pos: int) -> Tuple[str, int]:
+    size, pos = _read_varint(data, pos)
+    return bytes(data[pos : pos + size]).decode(), pos + size
+
+
+def _encode_json(out: bytearray, value: Any) -> None:
+    _encode_str(out, json.dumps(as_dict(value)))
+
+
+def _decode_json(data: bytes, pos: int) -> Tuple[Any, int]:
+    raw, pos = _decode_str(data, pos)
+    return json.loads(raw), pos
+
+
+def _array_codec(item: Codec) -> Codec:
+    encode_item, decode_item, exact = item
+
+    def encode(out: bytearray, value: Any) -> None:
+        _write_varint(out, len(value))
+        for entry in value:
+            encode_item(out, entry)
+
+    def decode(data: bytes, pos: int) -> Tuple[List[Any], int]:
+        size, pos = _read_varint(data, pos)
+        values = []
+        for _ in range(size):
+            entry, pos = decode_item(data, pos)
+            values.append(entry)
+        return values, pos
+
+    return encode, decode, exact
+
+
+def _dict_codec(item: Codec) -> Codec:
+    encode_item, decode_item, exact = item
+
+    def encode(out: bytearray, value: Any) -> None:
+        _write_varint(out, len(value))
+        for key, entry in value.items():
+            _encode_str(out, key)
+            encode_item(out, entry)
+
+    def decode(data: bytes, pos: int) -> Tuple[Dict[str, Any], int]:
+        size, pos = _read_varint(data, pos)
+        values = {}
+        for _ in range(size):
+            key, pos = _decode_str(data, pos)
+            values[key], pos = decode_item(data, pos)
+        return values, pos
+
+    return encode, decode, exact
+
+
+def _ref_codec(model: Type) -> Codec:
+    # resolved on use, data objects can reference themselves
+    def encode(out: bytearray, value: Any) -> None:
+        model_codec(model)[0](out, value)
+
+    def decode(data: bytes, pos: int) -> Tuple[Any, int]:
+        return model_codec(model)[1](data, pos)
+
+    return encode, decode, True
+
+
+def _codec(schema: types.JustSchema) -> Codec:
+    if isinstance(schema, types.BooleanType):
+        return _encode_bool, _decode_bool, True
+    if isinstance(schema, types.IntegerType):
+        return _encode_int, _decode_int, True
+    if isinstance(schema, types.NumericType):
+        return _encode_float, _decode_float, True
+    if isinstance(schema, types.StringType):
+        return _encode_str, _decode_str, True
+    if isinstance(schema, types.RefType):
+        model = schemas.ref_model(schema)
+        if model is not None:
+            return _ref_codec(model)
+    if isinstance(schema, types.ArrayType) and schema.items is not None:
+        return _array_codec(_codec(schema.items))
+    if isinstance(schema, types.ObjectType) and list(schema.patternProperties) == ["^.*$"]:
+        return _dict_codec(_codec(schema.patternProperties["^.*$"]))
+    # any other schema is stored as json and parsed again by the field converter
+    return _encode_json, _decode_json, False
+
+
+def _kind(schema: types.JustSchema, refs: List[Type]) -> Any:
+    # mirrors _codec, referenced data objects are added to refs
+    if isinstance(schema, types.BooleanType):
+        return "bool"
+    if isinstance(schema, types.IntegerType):
+        return "int"
+    if isinstance(schema, types.NumericType):
+        return "float"
+    if isinstance(schema, types.StringType):
+        return "str"
+    if isinstance(schema, types.RefType):
+        model = schemas.ref_model(schema)
+        if model is not None:
+            refs.append(model)
+            return {"ref": schemas.qualified_name(model)}
+    if isinstance(schema, types.ArrayType) and schema.items is not None:
+        return ["array", _kind(schema.items, refs)]
+    if isinstance(schema, types.ObjectType) and list(schema.patternProperties) == ["^.*$"]:
+        return ["dict", _kind(schema.patternProperties["^.*$"], refs)]
+    return "json"
+
+
+def layout(model: Type) -> Dict[str, List[Tuple[str, Any]]]:
+    """Describes the binary encoding of a data object and of the data objects it references
+
+    Returns:
+        the field names and codec kinds in encoding order, keyed by the qualified name of the
+        data object classes
+    """
+    layouts: Dict[str, List[Tuple[str, Any]]] = {}
+    pending = [model]
+    while pending:
+        current = pending.pop()
+        name = schemas.qualified_name(current)
+        if name in layouts:
+            continue
+        properties = schemas.model_schema(current).properties
+        refs: List[Type] = []
+        layouts[name] = [
+            (field.name, _kind(properties[field.name], refs)) for field in current.__attrs_attrs__
+        ]
+        pending.extend(refs)
+    return layouts
+
+
+def model_codec(model: Type) -> Codec:
+    """Compiles the binary encoding of a data object from its field schemas, cached per class
+
+    Fields are written in the `__attrs_attrs__` order after a bitmap of the fields set to None.
+    Integers are zigzag varints, numbers 8 byte doubles, strings and collections are length
+    prefixed. Fields with schemas that have no binary encoding, eg compositions, are stored as
+    json.
+    """
+    cached = _CODECS.get(model)
+    if cached is not None:
+        return cached
+
+    properties = schemas.model_schema(model).properties
+    fields = []
+    for field in model.__attrs_attrs__:
+        encode_field, decode_field, exact = _codec(properties[field.name])
+        fields.append(
+            (field.name, encode_field, decode_field, None if exact else field.converter)
+        )
+    bitmap_size = (len(fields) + 7) // 8
+
+    def encode(out: bytearray, instance: Any) -> None:
+        values = instance.__dict__
+        bitmap = 0
+        for index, (name, _, _, _) in enumerate(fields):
+            if values[name] is None:
+                bitmap |= 1 << index
+        out += bitmap.to_bytes(bitmap_size, "little")
+        for name, encode_field, _, _ in fields:
+            value = values[name]
+            if value is not None:
+                encode_field(out, value)
+
+    def decode(data: bytes, pos: int) -> Tuple[Any, int]:
+        bitmap = int.from_bytes(data[pos : pos + bitmap_size], "little")
+        pos += bitmap_size
+        values: Dict[str, Any] = {}
+        for index, (name, _, decode_field, converter) in enumerate(fields):
+            if bitmap >> index & 1:
+                values[name] = None
+                continue
+            value, pos = decode_field(data, pos)
+            values[name] = value if converter is None else converter(value)
+        # encoded from a validated instance with the same layout, see the header check
+        instance = object.__new__(model)
+        instance.__dict__.update(values)
+        return instance, pos
+
+    codec: Codec = (encode, decode, True)
+    _CODECS[model] = codec
+    return codec
+
+
+def header(model: Type) -> bytes:
+    """Payload header of a data object, the format marker and a digest of its encoded layout
+
+    The digest only covers the `layout` of the data object, payloads stay readable across
+    processes and library versions as long as the encoding of the fields is unchanged.
+    """
+    cached = _HEADERS.get(model)
+    if cached is None:
+        document = json.dumps([schemas.qualified_name(model), layout(model)], sort_keys=True)
+        cached = MAGIC + hashlib.sha256(document.encode()).digest()[:8]
+        _HEADERS[model] = cached
+    return cached
+
+
+def dumps(instance: Any) -> bytes:
+    """Encodes a data object instance, see `model_codec` for the layout
+
+    The payload starts with a header holding a digest of the encoded layout of the data object
+    """
+    model = type(instance)
+    out = bytearray(header(model))
+    try:
+        model_codec(model)[0](out, instance)
+    except (AttributeError, TypeError, struct.error) as e:
+        raise BinaryFormatError(f"Unable to encode {model} instance: {e}") from e
+    return bytes(out)
+
+
+def loads(model: Type[T], data: bytes) -> T:
+    """Decodes a data object instance encoded with `dumps`
+
+    Instances are restored without running the validation again
+
+    Raises:
+        BinaryFormatError: the payload is malformed or written for another definition of the
+            data object
+    """
+    if bytes(data[:HEADER_SIZE]) != header(model):
+        raise BinaryFormatError(f"Payload was not encoded for this version of {model}")
+    try:
+        instance, pos = model_codec(model)[1](data, HEADER_SIZE)
+    except (IndexError, UnicodeDecodeError, ValueError, struct.error) as e:
+        raise BinaryFormatError(f"Malformed payload for {model}: {e}") from e
+    if pos != len(data):
+        raise BinaryFormatError(f"Malformed payload for {model}: trailing bytes")
+    return instance  # type: ignore
@@ -0,0 +1,173 @@
+import importlib
+import json
+import logging
+import os
+import re
+import tempfile
+import warnings
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "JUSTOBJECTS_CACHE_DIR"
+COMPILED_MODULE = "_jo_compiled"
+
+_cache_dir: Optional[Path] = None
+_compiled: Dict[str, Optional[Dict[str, Any]]] = {}
+
+__all__ = [
+    "StaleCacheWarning",
+    "disable",
+    "enable",
+    "is_enabled",
+    "load",
+    "load_compiled",
+    "store",
+]
+
+
+class StaleCacheWarning(UserWarning):
+    """Raised when a cached schema no longer matches the data object definition"""
+
+
+def enable(directory: Union[str, Path]) -> None:
+    """Turns on the on-disk schema cache
+
+    Generated data object schemas are written to `directory` and re-used on later imports as
+    long as the fingerprint of the data object fields has not changed. The cache can also be
+    enabled by setting the `JUSTOBJECTS_CACHE_DIR` environment variable.
+
+    Args:
+        directory: folder where the cached schemas are stored, created if missing
+    Example:
+        .. code-block:: python
+
+            from justobjects import cache
+
+            cache.enable("/tmp/jo-cache")
+    """
+    global _cache_dir
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    _cache_dir = path
+
+
+def disable() -> None:
+    """Turns off the on-disk schema cache"""
+    global _cache_dir
+    _cache_dir = None
+
+
+def is_enabled() -> bool:
+    return _cache_dir is not None
+
+
+def _entry_path(key: str) -> Path:
+    assert _cache_dir is not None
+    return _cache_dir / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.json"
+
+
+def load(key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+    """Retrieves a cached schema
+
+    Args:
+        key: qualified name of the data object class
+        fingerprint: hash of the current data object definition
+    Returns:
+        the cached schema, None if the cache is disabled, missing or stale
+    """
+    if _cache_dir is None:
+        return None
+
+    path = _entry_path(key)
+    try:
+        with path.open("r", encoding="utf-8") as fp:
+            entry = json.load(fp)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable schema cache entry {path}: {e}")
+        return None
+
+    if entry.get("fingerprint") != fingerprint:
+        warnings.warn(
+            f"Cached schema for '{key}' is stale and will be regenerated", StaleCacheWarning
+        )
+        return None
+    return entry.get("schema")
+
+
+def store(key: str, fingerprint: str, schema: Dict[str, Any]) -> None:
+    """Writes a schema to the cache, does nothing when the cache is disabled
+
+    Args:
+        key: qualified name of the data object class
+        fingerprint: hash of the current data object definition
+        schema: json schema dictionary
+    """
+    if _cache_dir is None:
+        return
+
+    path = _entry_path(key)
+    try:
+        content = json.dumps({"fingerprint": fingerprint, "schema": schema})
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Schema for '{key}' is not json serializable, skipping cache: {e}")
+        return
+
+    fd, tmp = tempfile.mkstemp(dir=str(_cache_dir), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            fp.write(content)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Unable to write schema cache entry {path}: {e}")
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _compiled_schemas(package: str) -> Optional[Dict[str, Any]]:
+    if package not in _compiled:
+        try:
+            module = importlib.import_module(f"{package}.{COMPILED_MODULE}")
+            _compiled[package] = getattr(module, "SCHEMAS", None)
+        except ImportError:
+            _compiled[package] = None
+    return _compiled[package]
+
+
+def load_compiled(module: str, key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+    """Retrieves the entry of a data object from a module generated by
+    `python -m justobjects compile`
+
+    The generated module is looked up as `_jo_compiled` in the package of the data object module
+    and then in its parent packages.
+
+    Args:
+        module: name of the module defining the data object class
+        key: qualified name of the data object class
+        fingerprint: hash of the current data object definition
+    Returns:
+        the entry with the `schema` and `definition` of the data object, None if there is no
+        generated module or it is stale
+    """
+    parts = module.split(".")
+    for size in range(len(parts) - 1, 0, -1):
+        compiled = _compiled_schemas(".".join(parts[:size]))
+        if not compiled or key not in compiled:
+            continue
+        entry: Dict[str, Any] = compiled[key]
+        if entry.get("fingerprint") != fingerprint:
+            warnings.warn(
+                f"Compiled schema for '{key}' is stale and will be regenerated, "
+                f"run `python -m justobjects compile` again",
+                StaleCacheWarning,
+            )
+            return None
+        return entry
+    return None
+
+
+if os.environ.get(CACHE_DIR_ENV):
+    enable(os.environ[CACHE_DIR_ENV])
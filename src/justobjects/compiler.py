@@ -0,0 +1,72 @@
+import importlib
+import json
+import logging
+import pkgutil
+from typing import Any, Dict, Iterable
+
+from justobjects import cache, schemas
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["collect", "render"]
+
+HEADER = '''"""Schemas of justobjects data objects, generated by `python -m justobjects compile`
+
+Do not edit, the entries are ignored once the data objects change. Generate the module again to
+refresh them.
+"""
+
+'''
+
+
+def _in_modules(name: str, modules: Iterable[str]) -> bool:
+    return any(name == module or name.startswith(f"{module}.") for module in modules)
+
+
+def _import(name: str) -> None:
+    module = importlib.import_module(name)
+    for info in pkgutil.walk_packages(getattr(module, "__path__", ()), f"{name}."):
+        if not info.name.endswith(f".{cache.COMPILED_MODULE}"):
+            importlib.import_module(info.name)
+
+
+def collect(modules: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Imports modules and extracts the schemas of the data objects they define
+
+    Args:
+        modules: names of the modules, the sub-modules of packages are also imported
+    Returns:
+        entries keyed by the qualified name of the data object classes
+    """
+    modules = list(modules)
+    for module in modules:
+        _import(module)
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    for model in sorted(schemas.JUST_OBJECTS.models(), key=schemas.qualified_name):
+        if not _in_modules(model.__module__, modules) or not schemas.is_cacheable(model):
+            continue
+        key = schemas.qualified_name(model)
+        try:
+            entry = {
+                "fingerprint": schemas.fingerprint(model),
+                "schema": schemas.model_dict(model),
+                "definition": schemas.model_definition(model),
+            }
+            # normalizes the schemas to plain literals
+            entries[key] = json.loads(json.dumps(entry))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping '{key}', its schema is not json serializable: {e}")
+    return entries
+
+
+def render(entries: Dict[str, Dict[str, Any]]) -> str:
+    """Renders the source of the generated module
+
+    The entries are embedded as a json document, which keeps their key order on every supported
+    python version. json escapes all quotes and non ascii characters, so the document is always a
+    valid raw string literal.
+    """
+
+    document = json.dumps(entries, indent=4)
+    return f'{HEADER}import json\n\nSCHEMAS = json.loads(\n    r"""\n{document}\n"""\n)\n'
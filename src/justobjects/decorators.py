@@ -1,4 +1,9 @@
 import abc
+import functools
+import operator
+import pickle
+import threading
+import time
 from functools import partial
 from typing import (
     Any,
@@ -7,6 +12,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -15,7 +21,14 @@ from typing import (
 
 import attr
 
-from justobjects import schemas, transforms, typings
+from justobjects import (
+    binary,
+    instrumentation,
+    schemas,
+    transforms,
+    typings,
+    validation,
+)
 from justobjects.transforms import as_dict
 from justobjects.types import (
     AllOfType,
@@ -36,6 +49,9 @@ JO_OBJECT_DESC = "__jo__object_desc__"
 
 T = TypeVar("T")
 
+# start times of the data objects being created on the current thread, innermost last
+_creating = threading.local()
+
 
 class JustObject(typings.Protocol):
     __name__: str
@@ -55,11 +71,65 @@ class JustObject(typings.Protocol):
         ...
 
 
+def _creation_starts() -> List[float]:
+    starts = getattr(_creating, "starts", None)
+    if starts is None:
+        starts = _creating.starts = []
+    return cast(List[float], starts)
+
+
+def _check_arguments(
+    arguments: Tuple[str, ...], limits: validation.Limits, args: Tuple[Any, ...], kwargs: Any
+) -> None:
+    payload = dict(zip(arguments, args))
+    payload.update(kwargs)
+    deadline = None if limits.timeout is None else time.monotonic() + limits.timeout
+    validation.check_limits(payload, limits, deadline)
+
+
+def _wrap_init(
+    init: Callable[..., None], arguments: Tuple[str, ...], limits: Optional[validation.Limits]
+) -> Callable[..., None]:
+    """Wraps the generated `__init__`
+
+    The raw arguments are checked against the limits of the data object as a single payload,
+    before any field is converted. With instrumentation enabled, the field conversions of an
+    instance are timed as a single `parse` call ending when `__attrs_post_init__` starts.
+    """
+
+    @functools.wraps(init)
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        if limits is not None:
+            _check_arguments(arguments, limits, args, kwargs)
+        if not instrumentation.enabled:
+            init(self, *args, **kwargs)
+            return
+        starts = _creation_starts()
+        depth = len(starts)
+        starts.append(time.perf_counter())
+        try:
+            init(self, *args, **kwargs)
+        finally:
+            # conversions that failed never reach __attrs_post_init__
+            del starts[depth:]
+
+    return __init__
+
+
 def __attrs_post_init__(self: JustObject) -> None:
+    timed = instrumentation.enabled
+    start = time.perf_counter() if timed else 0.0
+    if timed:
+        starts = _creation_starts()
+        if starts:
+            instrumentation.record(type(self), instrumentation.PARSE, start - starts.pop())
     if hasattr(self, "__jo_attrs_post_init__"):
         self.__jo_attrs_post_init__()
     if hasattr(self, "__jo_post_init__"):
         self.__jo_post_init__()
+    if timed:
+        elapsed = time.perf_counter() - start
+        instrumentation.record(type(self), instrumentation.POST_INIT, elapsed)
     schemas.validate(self)
 
 
@@ -67,6 +137,46 @@ def __as_dict(self: Type) -> Dict[str, Any]:
     return as_dict(self)
 
 
+def _values_getter(names: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    if len(names) == 1:
+        return lambda values: (values[names[0]],)
+    if not names:
+        return lambda values: ()
+    return operator.itemgetter(*names)
+
+
+def __to_binary(self: Any) -> bytes:
+    return binary.dumps(self)
+
+
+def __from_binary(cls: Type[T], data: bytes) -> T:
+    return binary.loads(cls, data)
+
+
+def __getstate(self: Any) -> Tuple[Any, ...]:
+    # instances built through __init__ are always validated, their state is the tuple of field
+    # values
+    return self.__jo__values__(self.__dict__)
+
+
+def __setstate(self: Any, state: Union[Tuple[Any, ...], Dict[str, Any]]) -> None:
+    """Restores a pickled data object without running the field converters
+
+    The validation is skipped for validated instances, pickled as tuples of field values. Other
+    states, eg the `__dict__` of instances pickled by earlier versions, are validated.
+    """
+    if isinstance(state, tuple):
+        names = self.__jo__fields__
+        if len(state) != len(names):
+            raise pickle.UnpicklingError(
+                f"pickled fields do not match the fields of {type(self)}"
+            )
+        self.__dict__.update(zip(names, state))
+        return
+    self.__dict__.update(state)
+    schemas.validate(self)
+
+
 def attribute_transformer(cls: Type, fields: List[attr.Attribute]) -> List[attr.Attribute]:
     results: List[attr.Attribute] = []
     for field in fields:
@@ -76,13 +186,26 @@ def attribute_transformer(cls: Type, fields: List[attr.Attribute]) -> List[attr.
     return results
 
 
-def data(frozen: bool = True, typed: bool = False) -> Callable[[Type], Type]:
+def data(
+    frozen: bool = True,
+    typed: bool = False,
+    lazy: bool = False,
+    limits: Optional[validation.Limits] = None,
+    backend: Union[str, validation.Backend, None] = None,
+) -> Callable[[Type], Type]:
     """decorates a class automatically binding it to a Schema instance
     This technically extends `attr.s` amd pulls out a Schema instance in the process
 
     Args:
         frozen: frozen data class
         typed: set to True to use typings
+        lazy: defer building the schema until it is first shown, validated or an instance is
+            created
+        limits: bounds on the depth, array lengths, size and validation time of untrusted
+            payloads. The constructor arguments are checked as a single payload before any
+            field is converted, the validation of the instance is then also bounded
+        backend: validation backend instance or name registered with
+            `validation.register_backend`, defaults to the globally selected backend
     Returns:
         a JustSchema object wrapper
     Example:
@@ -99,17 +222,31 @@ def data(frozen: bool = True, typed: bool = False) -> Callable[[Type], Type]:
             jo.show_schema(Sample)
     """
 
+    validation.get_backend(backend)
+
     def wraps(cls: Type) -> Type:
 
         if hasattr(cls, "__attrs_post_init__"):
             setattr(cls, "__jo_attrs_post_init__", cls.__attrs_post_init__)
         setattr(cls, "__attrs_post_init__", __attrs_post_init__)
         setattr(cls, "as_dict", __as_dict)
+        setattr(cls, "to_binary", __to_binary)
+        setattr(cls, "from_binary", classmethod(__from_binary))
+        if not {"__reduce__", "__reduce_ex__", "__getstate__", "__setstate__"} & set(vars(cls)):
+            setattr(cls, "__getstate__", __getstate)
+            setattr(cls, "__setstate__", __setstate)
 
         cls = attr.s(
             cls, auto_attribs=typed, frozen=frozen, field_transformer=attribute_transformer
         )
-        schemas.transform_properties(cast(typings.AttrClass, cls))
+        arguments = tuple(field.alias for field in cls.__attrs_attrs__ if field.init)
+        setattr(cls, "__init__", _wrap_init(cls.__init__, arguments, limits))
+        names = tuple(field.name for field in cls.__attrs_attrs__)
+        setattr(cls, "__jo__fields__", names)
+        setattr(cls, "__jo__values__", staticmethod(_values_getter(names)))
+        schemas.transform_properties(
+            cast(typings.AttrClass, cls), lazy=lazy, limits=limits, backend=backend
+        )
         return cls
 
     return wraps
@@ -179,12 +316,11 @@ def ref(
     Returns:
         a schema reference attribute wrapper
     """
-    obj = schemas.transform(ref_type)
     return attr.ib(
         type=ref_type,
         default=default,
         metadata={
-            JO_SCHEMA: schemas.as_ref(ref_type, obj, description),
+            JO_SCHEMA: schemas.reference(ref_type, description),
             JO_TYPE: ref_type,
             JO_REQUIRED: required,
         },
@@ -313,7 +449,7 @@ def array(
     Returns:
         A array attribute wrapper
     """
-    _type = schemas.as_ref(item, schemas.transform(item))
+    _type = schemas.reference(item)
     if contains:
         sc = ArrayType(
             contains=_type,
@@ -346,7 +482,7 @@ def any_of(
     """JSON schema anyOf"""
 
     item_types = tuple(t for t in types)
-    items = [schemas.as_ref(cls, schemas.transform(cls)) for cls in types]
+    items = [schemas.reference(cls) for cls in types]
     sc = AnyOfType(anyOf=items, description=description)
     return attr.ib(
         type=Union[item_types], default=default, metadata={JO_SCHEMA: sc, JO_REQUIRED: required}
@@ -369,7 +505,7 @@ def one_of(
         attr.ib: field instance
     """
     item_types = tuple(t for t in types)
-    items = [schemas.as_ref(cls, schemas.transform(cls)) for cls in types]
+    items = [schemas.reference(cls) for cls in types]
     sc = OneOfType(oneOf=items, description=description)
     return attr.ib(
         type=Union[item_types], default=default, metadata={JO_SCHEMA: sc, JO_REQUIRED: required}  # type: ignore
@@ -385,7 +521,7 @@ def all_of(
     """JSON schema allOf"""
 
     item_types = tuple(t for t in types)
-    items = [schemas.as_ref(cls, schemas.transform(cls)) for cls in types]
+    items = [schemas.reference(cls) for cls in types]
     sc = AllOfType(allOf=items, description=description)
     return attr.ib(
         type=List[Union[item_types]],  # type: ignore
@@ -395,6 +531,6 @@ def all_of(
 
 
 def must_not(item: Type, description: Optional[str] = None) -> attr.Attribute:
-    obj = schemas.as_ref(item, schemas.transform(item))
+    obj = schemas.reference(item)
     sc = NotType(mustNot=obj, description=description)
     return attr.ib(type=object, default=None, metadata={JO_SCHEMA: sc})
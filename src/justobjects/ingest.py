@@ -0,0 +1,236 @@
+import csv
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import attr
+
+from justobjects import schemas, types
+from justobjects.validation import ValidationError, ValidationException
+
+__all__ = ["RowError", "coerce", "iter_csv"]
+
+T = TypeVar("T")
+Column = Tuple[int, str, Callable[[str], Any]]
+Plan = Callable[[Mapping[str, Any]], Dict[str, Any]]
+
+_PLANS: "weakref.WeakKeyDictionary[Type, Plan]" = weakref.WeakKeyDictionary()
+
+
+@attr.s(auto_attribs=True)
+class RowError:
+    """A csv row that could not be loaded as a data object
+
+    Attributes:
+        line: line number of the row in the file, the header being on line 1
+        row: raw cells of the row keyed by column name
+        errors: validation errors of the row
+    """
+
+    line: int
+    row: Dict[str, str]
+    errors: List[ValidationError]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _converter(schema: types.JustSchema) -> Callable[[Any], Any]:
+    """Conversion of the values of a field, values are validated with the data object
+
+    Nested data objects are converted to dictionaries of converted fields, array items and
+    dictionary values with the schema of their items. Values of other shapes are left unchanged.
+    """
+    if isinstance(schema, types.RefType):
+        model = schemas.ref_model(schema)
+        if model is None:
+            return _identity
+        return lambda value: plan(model)(value) if isinstance(value, Mapping) else value
+
+    if isinstance(schema, types.ArrayType):
+        convert_item = _converter(schema.items) if schema.items else _identity
+        if convert_item is _identity:
+            return _identity
+        return lambda value: (
+            [convert_item(v) for v in value] if isinstance(value, (list, tuple)) else value
+        )
+
+    if isinstance(schema, types.ObjectType):
+        if list(schema.patternProperties) != ["^.*$"]:
+            return _identity
+        convert_value = _converter(schema.patternProperties["^.*$"])
+        if convert_value is _identity:
+            return _identity
+        return lambda value: (
+            {k: convert_value(v) for k, v in value.items()}
+            if isinstance(value, Mapping)
+            else value
+        )
+
+    if not isinstance(schema, types.BasicType):
+        return _identity
+    compiled = types.coercer(schema)
+    if compiled.parse is not None:
+        return compiled.parse
+    if compiled.converter is not None:
+        return compiled
+    return _identity
+
+
+def plan(model: Type) -> Plan:
+    """Compiles the conversion of raw field values of a data object, cached per class
+
+    The plan maps a dictionary of raw values keyed by field name to the converted keyword
+    arguments of the class, unknown keys are dropped.
+    """
+    cached = _PLANS.get(model)
+    if cached is not None:
+        return cached
+
+    properties = schemas.model_schema(model).properties
+    fields = [
+        (field.name, field.alias, _converter(properties[field.name]))
+        for field in model.__attrs_attrs__
+        if field.init
+    ]
+
+    def compiled(data: Mapping[str, Any]) -> Dict[str, Any]:
+        return {alias: convert(data[name]) for name, alias, convert in fields if name in data}
+
+    _PLANS[model] = compiled
+    return compiled
+
+
+def coerce(model: Type[T], data: Mapping[str, Any]) -> T:
+    """Creates a data object from raw values, eg query parameters, form posts or environment
+    variables
+
+    Each field value is converted with the schema of the field, including nested data objects
+    and arrays, the data object is then validated once on creation.
+
+    Example:
+        .. code-block:: python
+
+            import justobjects as jo
+
+            actor = jo.coerce(Actor, {"name": "Ann", "age": "42", "married": "yes"})
+
+    Args:
+        model: data object class
+        data: raw values keyed by field name, unknown keys are ignored
+    Returns:
+        the data object instance
+    Raises:
+        ValidationException
+    """
+    return model(**plan(model)(data))  # type: ignore
+
+
+def _columns(
+    model: Type, header: List[str], header_map: Optional[Dict[str, str]]
+) -> Tuple[List[Column], List[str]]:
+    properties = schemas.model_schema(model).properties
+    fields = {field.name: field for field in model.__attrs_attrs__ if field.init}
+    columns: List[Column] = []
+    for index, column in enumerate(header):
+        name = header_map.get(column, column) if header_map else column
+        field = fields.get(name)
+        if field is not None:
+            columns.append((index, field.alias, _converter(properties[field.name])))
+
+    required = [field.alias for field in fields.values() if field.default is attr.NOTHING]
+    return columns, required
+
+
+def _field_error(name: str, error: ValidationError) -> ValidationError:
+    element = f"{name}.{error.element}" if error.element else name
+    return ValidationError(element, error.message)
+
+
+def iter_csv(
+    model: Type[T],
+    fileobj: Iterable[str],
+    dialect: Union[str, csv.Dialect] = "excel",
+    header_map: Optional[Dict[str, str]] = None,
+    **fmtparams: Any,
+) -> Iterator[Union[T, RowError]]:
+    """Streams the rows of a csv file as data objects
+
+    The first row is the header, columns are matched to the fields of the data object by name,
+    unknown columns are ignored. Cells are converted with the schema of their field, empty cells
+    are treated as missing values. Each row is validated once, when the data object is created,
+    invalid rows, including cells that fail to convert, are yielded as `RowError` instead.
+
+    Example:
+        .. code-block:: python
+
+            import justobjects as jo
+
+            with open("actors.tsv", newline="") as f:
+                for actor in jo.iter_csv(Actor, f, dialect="excel-tab", header_map={"Name": "name"}):
+                    if isinstance(actor, jo.RowError):
+                        report(actor)
+                    ...
+
+    Args:
+        model: data object class
+        fileobj: file object or any iterable of csv lines
+        dialect: csv dialect, eg `excel-tab` for tab separated values
+        header_map: maps column names to field names
+        fmtparams: formatting parameters of `csv.reader`
+    Returns:
+        generator of data objects or row errors
+    """
+    reader = csv.reader(fileobj, dialect, **fmtparams)
+    header = next(reader, None)
+    if header is None:
+        return
+    columns, required = _columns(model, header, header_map)
+
+    for cells in reader:
+        if not cells:
+            continue
+        size = len(cells)
+        values: Dict[str, Any] = {}
+        errors: List[ValidationError] = []
+        failed: Set[str] = set()
+        for index, name, convert in columns:
+            if index >= size or cells[index] == "":
+                continue
+            try:
+                values[name] = convert(cells[index])
+            except ValidationException as e:
+                # converters registered with `register_converter` may validate as they convert
+                errors.extend(_field_error(name, error) for error in e.errors)
+                failed.add(name)
+            except (TypeError, ValueError) as e:
+                errors.append(ValidationError(name, str(e)))
+                failed.add(name)
+        errors.extend(
+            ValidationError("", f"'{name}' is a required property")
+            for name in required
+            if name not in values and name not in failed
+        )
+        if errors:
+            yield RowError(reader.line_num, dict(zip(header, cells)), errors)
+            continue
+        try:
+            instance = model(**values)
+        except ValidationException as e:
+            yield RowError(reader.line_num, dict(zip(header, cells)), e.errors)
+            continue
+        yield instance
@@ -0,0 +1,111 @@
+import threading
+from typing import Callable, Dict, List, Optional, Type
+
+PARSE = "parse"
+POST_INIT = "post_init"
+VALIDATE = "validate"
+SERIALIZE = "serialize"
+PHASES = (PARSE, POST_INIT, VALIDATE, SERIALIZE)
+
+Callback = Callable[[Type, str, float], None]
+
+# checked inline on the hot paths, keeps the overhead to a global lookup when disabled
+enabled = False
+
+__all__ = ["Collector", "disable", "enable", "is_enabled", "record", "reset", "stats"]
+
+
+class Collector:
+    """Thread safe aggregation of invocation counts and cumulative time per data object class
+    and phase
+
+    Phases are `parse` (the field conversions of an instance), `post_init`, `validate` and
+    `serialize`, each counted once per instance. Timings are inclusive, the time spent on nested
+    data objects is also part of the enclosing object.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, List[float]]] = {}
+
+    def record(self, model: Type, phase: str, elapsed: float) -> None:
+        key = f"{model.__module__}.{model.__qualname__}"
+        with self._lock:
+            entry = self._stats.setdefault(key, {}).setdefault(phase, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Exports the statistics as plain dictionaries
+
+        Example:
+            .. code-block:: python
+
+                {"tests.models.Actor": {"validate": {"count": 2, "total": 0.0004}}}
+        """
+        with self._lock:
+            return {
+                model: {
+                    phase: {"count": int(count), "total": total}
+                    for phase, (count, total) in phases.items()
+                }
+                for model, phases in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_collector = Collector()
+_callbacks: List[Callback] = []
+
+
+def enable(callback: Optional[Callback] = None) -> Collector:
+    """Starts recording timings of the data objects hot paths
+
+    Args:
+        callback: optional function invoked with the data object class, phase name and elapsed
+            seconds of every recorded call
+    Returns:
+        the collector aggregating the timings
+    Example:
+        .. code-block:: python
+
+            import justobjects as jo
+
+            jo.instrumentation.enable()
+            ...
+            metrics.push(jo.instrumentation.stats())
+    """
+    global enabled
+    if callback is not None and callback not in _callbacks:
+        _callbacks.append(callback)
+    enabled = True
+    return _collector
+
+
+def disable() -> None:
+    """Stops recording timings and drops registered callbacks, collected statistics are kept"""
+    global enabled
+    enabled = False
+    _callbacks.clear()
+
+
+def is_enabled() -> bool:
+    return enabled
+
+
+def record(model: Type, phase: str, elapsed: float) -> None:
+    _collector.record(model, phase, elapsed)
+    for callback in _callbacks:
+        callback(model, phase, elapsed)
+
+
+def stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Exports the collected statistics, see `Collector.as_dict`"""
+    return _collector.as_dict()
+
+
+def reset() -> None:
+    _collector.reset()
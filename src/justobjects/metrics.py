@@ -0,0 +1,132 @@
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import attr
+
+from justobjects import schemas, validation
+from justobjects.types import JustSchema
+
+__all__ = ["ErrorBucket", "ErrorHistogram"]
+
+
+@attr.s(auto_attribs=True)
+class ErrorBucket:
+    """Validation failures sharing the same data object, element and keyword
+
+    Attributes:
+        model: qualified name of the data object or the schema type
+        element: dotted path of the failing element, can be empty
+        keyword: json schema keyword that failed, eg `required`
+        count: number of failures
+        samples: first error messages seen for the bucket
+    """
+
+    model: str
+    element: str
+    keyword: str
+    count: int = 0
+    samples: List[str] = attr.ib(factory=list)
+
+
+class ErrorHistogram:
+    """Bounded aggregation of validation failures for batch or streaming validation
+
+    Errors are counted per `(model, element, keyword)` instead of being materialized as
+    `ValidationError` lists. At most `max_buckets` buckets are kept, failures that would open a
+    new bucket past that limit are only counted as dropped.
+
+    Example:
+        .. code-block:: python
+
+            from justobjects import metrics
+
+            histogram = metrics.ErrorHistogram(max_buckets=500, max_samples=3)
+            valid = [row for row in histogram.filter(Model, rows)]
+            report(histogram.summary())
+
+    Args:
+        max_buckets: maximum number of distinct buckets tracked
+        max_samples: maximum number of messages kept per bucket
+    """
+
+    def __init__(self, max_buckets: int = 1000, max_samples: int = 3) -> None:
+        self.max_buckets = max_buckets
+        self.max_samples = max_samples
+        self.validated = 0
+        self.failed = 0
+        self.dropped = 0
+        self._buckets: Dict[Tuple[str, str, str], ErrorBucket] = {}
+        self._validators: Dict[int, Tuple[JustSchema, validation.Validator]] = {}
+        self._lock = threading.Lock()
+
+    def _validator(self, schema: Any) -> Tuple[str, validation.Validator]:
+        if hasattr(schema, schemas.JO_STATE):
+            model = schema if isinstance(schema, type) else type(schema)
+            return schemas.qualified_name(model), schemas.model_validator(model)
+
+        entry = self._validators.get(id(schema))
+        if entry is None:
+            validator = validation.create_validator(schemas.show_schema(schema))
+            entry = self._validators[id(schema)] = (schema, validator)
+        return type(schema).__name__, entry[1]
+
+    def validate(self, schema: Any, instance: Any) -> bool:
+        """Validates an instance, recording its failures
+
+        Args:
+            schema: data object class or schema instance
+            instance: data to validate
+        Returns:
+            True if the instance is valid
+        """
+        name, validator = self._validator(schema)
+        valid = True
+        for error in validator.iter_errors(instance):
+            valid = False
+            self._record(name, error)
+        with self._lock:
+            self.validated += 1
+            self.failed += not valid
+        return valid
+
+    def filter(self, schema: Any, instances: Iterable[Any]) -> Iterator[Any]:
+        """Yields the valid instances, recording the failures of the invalid ones"""
+
+        for instance in instances:
+            if self.validate(schema, instance):
+                yield instance
+
+    def _record(self, name: str, error: Any) -> None:
+        key = (name, ".".join(str(entry) for entry in error.path), str(error.validator))
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_buckets:
+                    self.dropped += 1
+                    return
+                bucket = self._buckets[key] = ErrorBucket(*key)
+            bucket.count += 1
+            if len(bucket.samples) < self.max_samples:
+                bucket.samples.append(error.message)
+
+    def buckets(self) -> List[ErrorBucket]:
+        """Lists the recorded buckets, most frequent first"""
+
+        with self._lock:
+            return sorted(self._buckets.values(), key=lambda b: b.count, reverse=True)
+
+    def summary(self) -> Dict[str, Any]:
+        """Exports the aggregated failures as plain dictionaries"""
+
+        buckets = [attr.asdict(bucket) for bucket in self.buckets()]
+        return {
+            "validated": self.validated,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "buckets": buckets,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.validated = self.failed = self.dropped = 0
+            self._buckets.clear()
@@ -0,0 +1,56 @@
+import gc
+from typing import Iterable, Optional, Type
+
+from justobjects import ingest, schemas, validation
+
+__all__ = ["warmup"]
+
+
+def warmup(models: Optional[Iterable[Type]] = None, freeze: bool = False) -> int:
+    """Builds the schemas, validators, regular expressions and coercion plans of data objects
+
+    Meant to be called in the parent process of prefork servers, eg in the gunicorn
+    `on_starting` hook, so that workers inherit the compiled state instead of building it on
+    their first requests.
+
+    With `freeze`, follow the `gc.freeze` documentation: disable collections early in the
+    parent so that no freed gaps end up in the shared pages, freeze right before forking and
+    enable collections again early in every worker.
+
+    Example:
+        .. code-block:: python
+
+            # gunicorn.conf.py
+            import gc
+
+            import justobjects as jo
+
+            gc.disable()
+
+
+            def on_starting(server):
+                import myapp.models
+
+                jo.warmup(freeze=True)  # right before the workers are forked
+
+
+            def post_fork(server, worker):
+                gc.enable()
+
+    Args:
+        models: data object classes, defaults to all registered data objects
+        freeze: move all objects tracked by the garbage collector to the permanent generation
+            with `gc.freeze`, collections in forked workers then leave the pages shared with
+            the parent untouched
+    Returns:
+        number of data objects warmed up
+    """
+    targets = schemas.JUST_OBJECTS.models() if models is None else list(models)
+    for model in targets:
+        validation.prepare(schemas.model_dict(model))
+        schemas.model_definition(model)
+        schemas.model_validator(model)
+        ingest.plan(model)
+    if freeze:
+        gc.freeze()
+    return len(targets)
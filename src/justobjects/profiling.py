@@ -0,0 +1,148 @@
+import contextlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
+
+import attr
+from jsonschema import Draft7Validator
+from jsonschema.validators import extend
+
+__all__ = ["KeywordCost", "ValidationProfile", "profile"]
+
+# the profile collecting the validations of the current thread
+_active = threading.local()
+
+
+@attr.s(auto_attribs=True)
+class KeywordCost:
+    """Cost of a single schema keyword
+
+    Attributes:
+        pointer: json pointer of the schema holding the keyword, eg `#/properties/name`
+        keyword: json schema keyword, eg `pattern`
+        count: number of invocations
+        total: cumulative seconds, including nested keywords
+        own: cumulative seconds, excluding nested keywords
+    """
+
+    pointer: str
+    keyword: str
+    count: int = 0
+    total: float = 0.0
+    own: float = 0.0
+
+
+class ValidationProfile:
+    """Aggregated validation cost by schema location and keyword"""
+
+    def __init__(self) -> None:
+        self._costs: Dict[Tuple[str, str], KeywordCost] = {}
+        self._local = threading.local()
+
+    @property
+    def _stack(self) -> List[float]:
+        # nested keyword timings of the validation running on the current thread
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return cast(List[float], stack)
+
+    def record(self, pointer: str, keyword: str, total: float, own: float) -> None:
+        cost = self._costs.get((pointer, keyword))
+        if cost is None:
+            cost = self._costs[(pointer, keyword)] = KeywordCost(pointer, keyword)
+        cost.count += 1
+        cost.total += total
+        cost.own += own
+
+    def entries(self, sort_by: str = "own") -> List[KeywordCost]:
+        """Lists keyword costs, most expensive first
+
+        Args:
+            sort_by: one of `own`, `total` or `count`
+        """
+        return sorted(self._costs.values(), key=lambda c: getattr(c, sort_by), reverse=True)
+
+    def as_dict(self, sort_by: str = "own") -> List[Dict[str, Any]]:
+        return [attr.asdict(cost) for cost in self.entries(sort_by)]
+
+    def report(self, limit: int = 20, sort_by: str = "own") -> str:
+        """Renders the most expensive keywords as a text table"""
+
+        lines = [f"{'own ms':>10} {'total ms':>10} {'calls':>8}  location"]
+        for cost in self.entries(sort_by)[:limit]:
+            lines.append(
+                f"{cost.own * 1000:>10.3f} {cost.total * 1000:>10.3f} {cost.count:>8}"
+                f"  {cost.pointer}/{cost.keyword}"
+            )
+        return "\n".join(lines)
+
+    def _timed(self, keyword: str, fn: Callable, pointers: Dict[int, str]) -> Callable:
+        def timed(validator: Any, value: Any, instance: Any, schema: Any) -> List[Any]:
+            stack = self._stack
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return list(fn(validator, value, instance, schema) or ())
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                self.record(pointers.get(id(schema), "#?"), keyword, elapsed, elapsed - nested)
+
+        return timed
+
+    def instrument(self, validator: Draft7Validator) -> Draft7Validator:
+        """Creates a copy of the validator which reports keyword timings to this profile"""
+
+        pointers = _pointers(validator.schema)
+        validators = {
+            keyword: self._timed(keyword, fn, pointers)
+            for keyword, fn in validator.VALIDATORS.items()
+        }
+        profiled = extend(type(validator), validators=validators)
+        return profiled(validator.schema, format_checker=validator.format_checker)
+
+
+def _pointers(schema: Any, pointer: str = "#") -> Dict[int, str]:
+    """Maps every sub-schema of a json schema to its json pointer"""
+
+    found: Dict[int, str] = {}
+    if isinstance(schema, dict):
+        found[id(schema)] = pointer
+        for key, value in schema.items():
+            escaped = str(key).replace("~", "~0").replace("/", "~1")
+            found.update(_pointers(value, f"{pointer}/{escaped}"))
+    elif isinstance(schema, list):
+        for i, value in enumerate(schema):
+            found.update(_pointers(value, f"{pointer}/{i}"))
+    return found
+
+
+def active() -> Optional[ValidationProfile]:
+    return cast(Optional[ValidationProfile], getattr(_active, "profile", None))
+
+
+@contextlib.contextmanager
+def profile() -> Iterator[ValidationProfile]:
+    """Attributes the cost of validations performed within the block to schema keywords
+
+    Only the validations running on the current thread are profiled.
+
+    Example:
+        .. code-block:: python
+
+            import justobjects as jo
+            from justobjects import profiling
+
+            with profiling.profile() as prof:
+                jo.validate(Model, payload)
+            print(prof.report())
+    """
+    previous = active()
+    _active.profile = current = ValidationProfile()
+    try:
+        yield current
+    finally:
+        _active.profile = previous
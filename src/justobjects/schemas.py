@@ -1,3 +1,8 @@
+import copy
+import hashlib
+import threading
+import time
+import weakref
 from collections import abc as ca
 from collections import defaultdict
 from typing import (
@@ -8,6 +13,7 @@ from typing import (
     DefaultDict,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -21,8 +27,9 @@ from typing import (
 )
 
 import attr
+from pkg_resources import get_distribution
 
-from justobjects import typings, validation
+from justobjects import cache, instrumentation, typings, validation
 from justobjects.transforms import as_dict
 from justobjects.types import (
     AnyOfType,
@@ -82,39 +89,401 @@ TYPE_MAP: Dict[Any, Type[JustSchema]] = {
     Text: StringType,
 }
 
-JUST_OBJECTS: Dict[str, SchemaType] = {}
+# guards one-time generation of schema artifacts, re-entrant as building a schema can trigger
+# the generation of referenced data objects
+_BUILD_LOCK = threading.RLock()
+# memoized schemas of the typing generics that reference no data object
+_GENERICS: Dict[Any, Any] = {}
 
 JO_TYPE = "__jo__type__"
 JO_SCHEMA = "__jo__"
 JO_REQUIRED = "__jo__required__"
+JO_STATE = "__jo__state__"
+
+# bumped whenever the generated schemas change shape, schemas cached or compiled by older
+# formats or library versions are then regenerated
+SCHEMA_FORMAT = 2
+_VERSION = get_distribution("justobjects").version
 
 __all__ = ["get_schema", "transform", "show_schema", "validate"]
 
 
-def add_schema(cls: typings.AttrClass, obj: SchemaType) -> None:
-    """Adds the schema of a data object to collection of schemas
+@attr.s(auto_attribs=True, eq=False)
+class ModelState:
+    """Schema artifacts generated for a data object class, computed on demand
+
+    Attributes:
+        schema: schema object graph of the data object
+        schema_dict: json schema dictionary exposed through `__jo__`
+        definition: json schema of the data object when embedded in other schemas
+        fingerprint: hash of the field definitions, used as the cache key
+        validator: validator compiled from `schema_dict`
+        limits: bounds enforced when validating instances of the data object
+        backend: validation backend of the data object, defaults to the selected backend
+        generics: memoized schemas of the typing generics referencing only this data object
+    """
+
+    schema: Optional[SchemaType] = None
+    schema_dict: Optional[Dict[str, Any]] = None
+    definition: Optional[Dict[str, Any]] = None
+    fingerprint: Optional[str] = None
+    validator: Optional[validation.Validator] = None
+    limits: Optional[validation.Limits] = None
+    backend: Union[str, validation.Backend, None] = None
+    generics: Dict[Any, Any] = attr.ib(factory=dict)
+
+
+def qualified_name(cls: Type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class ModelRegistry:
+    """Thread safe collection of data object classes
+
+    Classes are held through weak references so that dynamically created data objects, along
+    with their generated schemas and validators, can be garbage collected. Membership is tracked
+    per class, classes sharing a qualified name, eg built by the same factory, are registered
+    side by side.
+
+    Each class is assigned a definition name, unique among the live classes, under which it is
+    referenced in json schemas. The plain class name is used when it is free, otherwise the
+    qualified name, suffixed with a counter when that is taken as well.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._classes: "weakref.WeakSet[Type]" = weakref.WeakSet()
+        self._definitions: "weakref.WeakValueDictionary[str, Type]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._assigned: "weakref.WeakKeyDictionary[Type, str]" = weakref.WeakKeyDictionary()
+        self._models: "weakref.WeakValueDictionary[str, Type]" = weakref.WeakValueDictionary()
+        self._names: Dict[str, List[str]] = {}
+
+    def add(self, cls: Type) -> None:
+        """Registers a data object class and assigns its definition name"""
+
+        key = qualified_name(cls)
+        with self._lock:
+            if cls in self._classes:
+                return
+            base = cls.__name__ if cls.__name__ not in self._definitions else key
+            name, count = base, 1
+            while name in self._definitions:
+                count += 1
+                name = f"{base}_{count}"
+            self._classes.add(cls)
+            self._definitions[name] = cls
+            self._assigned[cls] = name
+            self._models[key] = cls
+            keys = self._names.setdefault(cls.__name__, [])
+            if key in keys:
+                keys.remove(key)
+            keys.append(key)
+        weakref.finalize(cls, self._discard, cls.__name__, key)
+
+    def _discard(self, name: str, key: str) -> None:
+        with self._lock:
+            keys = self._names.get(name, [])
+            if key in keys and key not in self._models:
+                keys.remove(key)
+            if not keys:
+                self._names.pop(name, None)
+
+    def definition_name(self, cls: Type) -> str:
+        """Retrieves the name a registered class is referenced by in json schemas"""
+
+        return self._assigned[cls]
+
+    def get(self, name: str) -> Optional[Type]:
+        """Retrieves a data object class by definition name, qualified name or plain class name
+
+        Qualified and plain names resolve to the most recently registered class that is still
+        alive.
+        """
+        model = self._definitions.get(name)
+        if model is not None:
+            return model
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        for key in reversed(self._names.get(name, [])):
+            model = self._models.get(key)
+            if model is not None:
+                return model
+        return None
+
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, str):
+            return self.get(item) is not None
+        try:
+            return item in self._classes
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._definitions.keys()))
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def models(self) -> List[Type]:
+        return list(self._classes)
+
+
+JUST_OBJECTS = ModelRegistry()
+
+
+def add_schema(cls: typings.AttrClass) -> None:
+    """Adds a data object class to the collection of known data objects
 
     Raises:
         Exception if cls is not a class type with the __name__ attribute
     """
 
-    JUST_OBJECTS[f"{cls.__name__}"] = obj
+    JUST_OBJECTS.add(cast(Type, cls))
+
+
+def clear_caches() -> None:
+    """Drops the memoized schemas of typing generics"""
+
+    _GENERICS.clear()
+    for model in JUST_OBJECTS.models():
+        _state(model).generics.clear()
+
+
+def _state(cls: Type) -> ModelState:
+    return cast(ModelState, getattr(cls, JO_STATE))
+
+
+def ref_model(ref: RefType) -> Optional[Type]:
+    """Resolves the data object class a reference points to"""
+
+    model = getattr(ref, JO_TYPE, None)
+    if model is not None:
+        return cast(Type, model)
+    return JUST_OBJECTS.get(ref.ref_name())
+
+
+def _iter_refs(schema: Any) -> Iterator[RefType]:
+    """Yields all the references enclosed within a schema"""
+
+    if isinstance(schema, RefType):
+        yield schema
+    elif isinstance(schema, ArrayType):
+        for enclosed in (schema.items, schema.contains):
+            yield from _iter_refs(enclosed)
+    elif isinstance(schema, NotType):
+        yield from _iter_refs(schema.mustNot)
+    elif isinstance(schema, CompositionType):
+        for enclosed in schema.get_enclosed_types():
+            yield from _iter_refs(enclosed)
+    elif isinstance(schema, ObjectType):
+        for enclosed in (*schema.properties.values(), *schema.patternProperties.values()):
+            yield from _iter_refs(enclosed)
+
+
+def _iter_types(cls: Any) -> Iterator[Type]:
+    """Yields a type annotation and all its generic arguments"""
+
+    yield cls
+    for arg in getattr(cls, "__args__", None) or ():
+        yield from _iter_types(arg)
+
+
+def _dependencies(cls: Type) -> List[Type]:
+    """Lists the data object classes referenced by the fields of a data object"""
+
+    found: Dict[str, Type] = {}
+    for prop in cls.__attrs_attrs__:
+        for prop_type in _iter_types(prop.metadata.get(JO_TYPE, prop.type)):
+            if isinstance(prop_type, type) and prop_type in JUST_OBJECTS:
+                found.setdefault(JUST_OBJECTS.definition_name(prop_type), prop_type)
+        for ref in _iter_refs(prop.metadata.get(JO_SCHEMA)):
+            ref_cls = ref_model(ref)
+            if ref_cls is not None and ref_cls in JUST_OBJECTS:
+                found.setdefault(JUST_OBJECTS.definition_name(ref_cls), ref_cls)
+    found.pop(JUST_OBJECTS.definition_name(cls), None)
+    return [found[key] for key in sorted(found)]
+
+
+def fingerprint(cls: Type) -> str:
+    """Computes a hash of the field definitions of a data object and its dependencies, along
+    with the library version and schema format that generate its schema"""
+
+    state = _state(cls)
+    if state.fingerprint is not None:
+        return state.fingerprint
+
+    digest = hashlib.sha256(f"{SCHEMA_FORMAT}:{_VERSION}".encode())
+    digest.update(f"{qualified_name(cls)}:{cls.__doc__}".encode())
+    for prop in cls.__attrs_attrs__:
+        entry = (
+            prop.name,
+            prop.type,
+            prop.default is attr.NOTHING,
+            prop.metadata.get(JO_TYPE),
+            prop.metadata.get(JO_SCHEMA),
+            prop.metadata.get(JO_REQUIRED),
+        )
+        digest.update(repr(entry).encode())
+    for dep in _dependencies(cls):
+        # dependencies are embedded under their definition name
+        digest.update(f"{JUST_OBJECTS.definition_name(dep)}:{fingerprint(dep)}".encode())
+    state.fingerprint = digest.hexdigest()
+    return state.fingerprint
+
+
+def is_cacheable(cls: Type) -> bool:
+    """Whether the schema of a data object can be stored under its qualified name
+
+    Classes defined inside functions are excluded, each call creates a class with the same
+    qualified name whose fields can differ.
+    """
+    return "<locals>" not in cls.__qualname__
+
 
+def _compiled_entry(cls: Type) -> Optional[Dict[str, Any]]:
+    if not is_cacheable(cls):
+        return None
+    return cache.load_compiled(cls.__module__, qualified_name(cls), fingerprint(cls))
 
-def _resolve_ref(ref: RefType, sc: SchemaType) -> None:
-    schema = cast(SchemaType, get_schema(ref))
-    sc.definitions.update(schema.definitions)
-    sc.definitions[ref.ref_name()] = schema.as_object()
 
+def model_schema(cls: Type) -> SchemaType:
+    """Retrieves the schema object of a data object, building it on first use"""
 
-def _resolve_compositions(comp: CompositionType, sc: SchemaType) -> None:
-    for _type in comp.get_enclosed_types():
-        if not isinstance(_type, RefType):
+    state = _state(cls)
+    if state.schema is None:
+        with _BUILD_LOCK:
+            if state.schema is None:
+                state.schema = build_schema(cast(typings.AttrClass, cls))
+    return state.schema
+
+
+def model_dict(cls: Type) -> Dict[str, Any]:
+    """Retrieves the json schema of a data object class
+
+    The schema is loaded from the module generated by `python -m justobjects compile` or from
+    the on-disk cache when enabled and up to date, otherwise it is generated and written back to
+    the cache. Classes defined inside functions are never cached, see `is_cacheable`.
+    """
+    state = _state(cls)
+    if state.schema_dict is not None:
+        return state.schema_dict
+
+    with _BUILD_LOCK:
+        if state.schema_dict is None:
+            key = qualified_name(cls)
+            compiled = _compiled_entry(cls)
+            schema_dict = compiled["schema"] if compiled is not None else None
+            cacheable = cache.is_enabled() and is_cacheable(cls)
+            if schema_dict is None and cacheable:
+                schema_dict = cache.load(key, fingerprint(cls))
+            if schema_dict is None:
+                schema_dict = bundle(model_schema(cls))
+                if cacheable:
+                    cache.store(key, fingerprint(cls), schema_dict)
+            state.schema_dict = schema_dict
+    return state.schema_dict
+
+
+def model_validator(cls: Type) -> validation.Validator:
+    """Retrieves the compiled validator of a data object class"""
+
+    state = _state(cls)
+    if state.validator is None:
+        schema_dict = model_dict(cls)
+        with _BUILD_LOCK:
+            if state.validator is None:
+                state.validator = validation.create_validator(schema_dict, state.backend)
+    return state.validator
+
+
+def model_definition(cls: Type) -> Dict[str, Any]:
+    """Retrieves the json schema of a data object as embedded in the definitions of the
+    schemas referencing it"""
+
+    state = _state(cls)
+    if state.definition is None:
+        compiled = _compiled_entry(cls)
+        if compiled is not None:
+            definition = compiled["definition"]
+        else:
+            definition = model_schema(cls).as_object().as_dict()
+        with _BUILD_LOCK:
+            if state.definition is None:
+                state.definition = definition
+    return state.definition
+
+
+def bundle(schema: JustSchema) -> Dict[str, Any]:
+    """Materializes a standalone json schema
+
+    Data objects are registered once and referenced by name, the definitions of all the data
+    objects reachable from the schema are collected from the registry and embedded in the result
+
+    Args:
+        schema: root schema
+    Returns:
+        a json schema dictionary
+    """
+    schema_dict = schema.as_dict()
+    definitions: Dict[str, Any] = dict(schema_dict.get("definitions", {}))
+
+    pending = list(_iter_refs(schema))
+    if isinstance(schema, SchemaType):
+        for definition in schema.definitions.values():
+            pending.extend(_iter_refs(definition))
+    pending.reverse()
+    while pending:
+        ref = pending.pop()
+        name = ref.ref_name()
+        model = ref_model(ref)
+        if name in definitions or model is None:
             continue
-        _resolve_ref(_type, sc)
+        definitions[name] = model_definition(model)
+        pending.extend(reversed(list(_iter_refs(model_schema(model)))))
+
+    if definitions:
+        schema_dict["definitions"] = definitions
+    return schema_dict
+
+
+def __jo__(cls: Type) -> Dict[str, Any]:
+    # the cached schema is shared with the validator, callers get their own copy
+    return copy.deepcopy(model_dict(cls))
+
+
+def transform_properties(
+    cls: typings.AttrClass,
+    lazy: bool = False,
+    limits: Optional[validation.Limits] = None,
+    backend: Union[str, validation.Backend, None] = None,
+) -> None:
+    """Registers a data object class and extracts its schema
 
+    When the on-disk cache is enabled and holds an up to date schema for the class, the schema
+    is loaded from the cache instead
 
-def transform_properties(cls: typings.AttrClass) -> None:
+    Attributes:
+        cls: Data object class
+        lazy: only register the class, the schema is built on first use
+        limits: bounds enforced when validating instances of the data object
+        backend: validation backend instance or name
+    """
+    setattr(cls, JO_STATE, ModelState(limits=limits, backend=backend))
+    setattr(cls, "__jo__", classmethod(__jo__))
+    add_schema(cls)
+
+    if lazy:
+        return
+    if cache.is_enabled() or _compiled_entry(cast(Type, cls)) is not None:
+        model_dict(cast(Type, cls))
+    else:
+        model_schema(cast(Type, cls))
+
+
+def build_schema(cls: typings.AttrClass) -> SchemaType:
     """Extract schema from a data object class
 
     Attributes:
@@ -130,43 +499,13 @@ def transform_properties(cls: typings.AttrClass) -> None:
 
         if prop.metadata.get(JO_REQUIRED, False) or prop.default == attr.NOTHING:
             sc.add_required(prop.name)
-        prop_schema = prop.metadata.get(JO_SCHEMA, transform(prop_type))
-
-        # negation, referenced and array type
-        if isinstance(prop_schema, (ArrayType, NotType, RefType)) and isinstance(
-            prop_schema.get_enclosed_type(), RefType
-        ):
-            enclosed = cast(RefType, prop_schema.get_enclosed_type())
-            _resolve_ref(enclosed, sc)
-            sc.properties[prop.name] = prop_schema
-            continue
-
-        # composition types
-        if isinstance(prop_schema, CompositionType):
-            _resolve_compositions(prop_schema, sc)
-            sc.properties[prop.name] = prop_schema
-            continue
-
-        if hasattr(prop_type, "__jo__") and not isinstance(prop_schema, RefType):
-            schema = cast(SchemaType, prop_schema)
-            sc.definitions.update(schema.definitions)
-            sc.definitions[prop_type.__name__] = schema.as_object()
-            sc.properties[prop.name] = as_ref(prop_type, schema)
-            continue
-
-        # transform objects to reference types
-        if typings.is_typed_container(prop_type) and isinstance(prop_schema, SchemaType):
-            sc.definitions.update(prop_schema.definitions)
-            sc.properties[prop.name] = prop_schema.as_object()
-            continue
+        prop_schema = prop.metadata.get(JO_SCHEMA) or reference(cast(Type, prop_type))
 
+        # typed dictionaries are embedded as plain objects
+        if isinstance(prop_schema, SchemaType):
+            prop_schema = prop_schema.as_object()
         sc.properties[prop.name] = prop_schema
-
-    def __jo__(cls: Type[JustSchema]) -> Dict[str, Any]:
-        return sc.as_dict()
-
-    setattr(cls, "__jo__", classmethod(__jo__))
-    add_schema(cls, sc)
+    return sc
 
 
 def get_schema(cls: Union[Type[JustSchema], RefType, BasicType]) -> Union[JustSchema, SchemaType]:
@@ -179,13 +518,14 @@ def get_schema(cls: Union[Type[JustSchema], RefType, BasicType]) -> Union[JustSc
         return cls
 
     if isinstance(cls, RefType):
-        class_name = cls.ref_name()
+        model = ref_model(cls)
     else:
-        class_name = cls.__name__
+        model = cls if cls in JUST_OBJECTS else None
 
-    if not class_name or class_name not in JUST_OBJECTS:
-        raise ValueError(f"Unrecognized data object class '{class_name}'")
-    return JUST_OBJECTS[class_name]
+    if model is None:
+        name = cls.ref_name() if isinstance(cls, RefType) else cls.__name__
+        raise ValueError(f"Unrecognized data object class '{name}'")
+    return model_schema(model)
 
 
 def show_schema(model: Any) -> Dict:
@@ -194,7 +534,7 @@ def show_schema(model: Any) -> Dict:
     Args:
         model: data object class type or instance
     Returns:
-        a json schema dictionary
+        a json schema dictionary, owned by the caller
 
     Examples:
         Creating and getting the schema associated with a simple integer type ::
@@ -205,7 +545,7 @@ def show_schema(model: Any) -> Dict:
             # {'minimum': 3, 'type': 'integer'}
     """
     if isinstance(model, JustSchema):
-        return model.as_dict()
+        return copy.deepcopy(bundle(model))
 
     if hasattr(model, "__jo__"):
         return model.__jo__()
@@ -215,32 +555,37 @@ def show_schema(model: Any) -> Dict:
 
     # generics
     if typings.is_typed_container(model):
-        return transform_typed_container(cast(typings.GenericMeta, model)).as_dict()
+        return copy.deepcopy(_show_typed_container(model))
 
     raise ValueError(f"Unrecognized data object {model}")
 
 
 @overload
-def validate(schema: JustSchema, instance: Any) -> None:
+def validate(
+    schema: JustSchema, instance: Any, limits: Optional[validation.Limits] = None
+) -> None:
     ...
 
 
 @overload
-def validate(schema: Type, instance: Any) -> None:
+def validate(schema: Type, instance: Any, limits: Optional[validation.Limits] = None) -> None:
     ...
 
 
 @overload
-def validate(schema: Any, instance: Any = None) -> None:
+def validate(
+    schema: Any, instance: Any = None, limits: Optional[validation.Limits] = None
+) -> None:
     ...
 
 
-def validate(schema, instance=None) -> None:  # type: ignore
+def validate(schema, instance=None, limits=None) -> None:  # type: ignore
     """Validates an object instance against its associated json schema
 
     Args:
         schema: a data object schema instance
         instance: data object instance
+        limits: bounds for untrusted payloads, defaults to the limits of the data object
     Raises:
         ValidationException: when there errors
     Examples:
@@ -256,8 +601,21 @@ def validate(schema, instance=None) -> None:  # type: ignore
           jo.validate(Model(a=4, b=True)
     """
     ins = instance or as_dict(schema)
+    if hasattr(schema, JO_STATE):
+        model = schema if isinstance(schema, type) else type(schema)
+        limits = limits or _state(model).limits
+        if not instrumentation.enabled:
+            validation.check(model_validator(model), ins, limits)
+            return
+
+        start = time.perf_counter()
+        try:
+            validation.check(model_validator(model), ins, limits)
+        finally:
+            instrumentation.record(model, instrumentation.VALIDATE, time.perf_counter() - start)
+        return
     sc = show_schema(schema)
-    validation.validate(sc, ins)
+    validation.validate(sc, ins, limits)
 
 
 def transform(cls: Type) -> JustSchema:
@@ -278,7 +636,57 @@ def transform(cls: Type) -> JustSchema:
     return get_schema(cast(Type[JustSchema], cls))
 
 
-def transform_typed_container(cls: typings.GenericMeta) -> JustSchema:  # type: ignore
+def _is_hashable(obj: Any) -> bool:
+    try:
+        hash(obj)
+    except TypeError:
+        return False
+    return True
+
+
+def _generics_memo(cls: Any) -> Optional[Dict[Any, Any]]:
+    """Selects where the schemas of a generic alias are memoized
+
+    Aliases referencing a single data object are memoized on that class and released along with
+    it, aliases without data objects in a bounded global cache. Aliases referencing several
+    data objects are not memoized, so that no class keeps another one alive.
+    """
+    if not _is_hashable(cls):
+        return None
+    models = {t for t in _iter_types(cls) if isinstance(t, type) and t in JUST_OBJECTS}
+    if not models:
+        if len(_GENERICS) > 1024:
+            _GENERICS.clear()
+        return _GENERICS
+    if len(models) == 1:
+        return _state(models.pop()).generics
+    return None
+
+
+def _show_typed_container(cls: Any) -> Dict[str, Any]:
+    memo = _generics_memo(cls)
+    if memo is None:
+        return bundle(transform_typed_container(cls))
+    schema_dict = memo.get(("dict", cls))
+    if schema_dict is None:
+        schema_dict = memo[("dict", cls)] = bundle(transform_typed_container(cls))
+    return cast(Dict[str, Any], schema_dict)
+
+
+def transform_typed_container(cls: typings.GenericMeta) -> JustSchema:
+    """Converts typing generics like `List[int]` or `Dict[str, Model]` into a schema, results
+    are memoized per generic alias"""
+
+    memo = _generics_memo(cls)
+    if memo is None:
+        return _resolve_typed_container(cls)
+    schema = memo.get(("schema", cls))
+    if schema is None:
+        schema = memo[("schema", cls)] = _resolve_typed_container(cls)
+    return cast(JustSchema, schema)
+
+
+def _resolve_typed_container(cls: typings.GenericMeta) -> JustSchema:  # type: ignore
     if not typings.is_typed_container(cls):
         raise ValueError()
 
@@ -292,19 +700,29 @@ def transform_typed_container(cls: typings.GenericMeta) -> JustSchema:  # type:
         _, val_type = cls.__args__
 
         obj_schema = SchemaType(title="")
-        val_schema = transform(val_type)
-        if is_referencable(val_type) and isinstance(val_schema, SchemaType):
-            obj_schema.definitions.update(val_schema.definitions)
-            obj_schema.definitions[f"{val_type.__name__}"] = val_schema.as_object()
-        obj_schema.patternProperties["^.*$"] = as_ref(val_type, val_schema)
+        obj_schema.patternProperties["^.*$"] = reference(val_type)
         return obj_schema
     raise ValueError(f"Unknown data type '{cls}'")
 
 
+def reference(cls: Type, description: Optional[str] = None) -> JustSchema:
+    """Transforms a class type into a schema, data objects are converted to references without
+    building their schema"""
+
+    if is_referencable(cls):
+        name = JUST_OBJECTS.definition_name(cls)
+        ref = RefType(ref=f"#/definitions/{name}", description=description)
+        # bind the class to the reference, it is skipped when the schema is serialized
+        setattr(ref, JO_TYPE, cls)
+        return ref
+    return transform(cls)
+
+
 def as_ref(obj_cls: Type, obj: JustSchema, description: Optional[str] = None) -> JustSchema:
     if not is_referencable(obj_cls):
         return obj
-    return RefType(ref=f"#/definitions/{obj_cls.__name__}", description=description)
+    name = JUST_OBJECTS.definition_name(obj_cls)
+    return RefType(ref=f"#/definitions/{name}", description=description)
 
 
 def is_referencable(cls: Type) -> bool:
@@ -312,7 +730,7 @@ def is_referencable(cls: Type) -> bool:
         return False
     if isinstance(cls, (set, list)):
         return False
-    return cls.__name__ in JUST_OBJECTS
+    return hasattr(cls, "__qualname__") and cls in JUST_OBJECTS
 
 
 def _resolve_typed_arrays(cls: typings.GenericMeta) -> ArrayType:
@@ -326,7 +744,7 @@ def _resolve_typed_arrays(cls: typings.GenericMeta) -> ArrayType:
 
     obj_cls = cls.__args__[0]
     is_set = cls.__origin__ in [ca.Set, Set, set]
-    ref = as_ref(obj_cls, transform(obj_cls))
+    ref = reference(obj_cls)
     return ArrayType(items=ref, minItems=1, uniqueItems=is_set)
 
 
@@ -336,7 +754,7 @@ def _resolve_unions(cls: typings.GenericMeta) -> Union[CompositionType, JustSche
         if arg.__name__ == "NoneType":
             continue
 
-        types.append(as_ref(arg, transform(arg)))
+        types.append(reference(arg))
     if len(types) > 1:
         return AnyOfType(anyOf=types)
     return types[0]
@@ -1,5 +1,9 @@
+import functools
+import re
+import time
 from collections import abc, defaultdict
-from datetime import datetime
+from datetime import date, datetime
+from datetime import time as day_time
 from typing import (
     Any,
     Container,
@@ -16,12 +20,8 @@ from typing import (
 
 import attr
 
-from justobjects import typings
+from justobjects import instrumentation, typings
 
-DATE_TYPES = (
-    datetime,
-    "datetime",
-)
 ITERABLE_TYPES = (
     Sequence,
     Iterable,
@@ -64,6 +64,44 @@ class JustData(typings.Protocol):
         ...
 
 
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+def _rfc3339(raw: str) -> str:
+    """Rewrites an RFC 3339 time into the form parsed by `fromisoformat` before python 3.11
+
+    A trailing `Z` becomes the `+00:00` offset and fractions of a second are padded or cut to
+    microseconds.
+    """
+    if raw[-1:] in ("Z", "z"):
+        raw = f"{raw[:-1]}+00:00"
+    return _FRACTION.sub(lambda m: f".{m.group(1)[:6]:0<6}", raw, count=1)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(raw: str) -> datetime:
+    """Parses an RFC 3339 date-time string, repeated timestamps are parsed only once"""
+    return datetime.fromisoformat(_rfc3339(raw))
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_date(raw: str) -> date:
+    return date.fromisoformat(raw)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_time(raw: str) -> day_time:
+    return day_time.fromisoformat(_rfc3339(raw))
+
+
+DATE_PARSERS = {
+    datetime: parse_datetime,
+    "datetime": parse_datetime,
+    date: parse_date,
+    day_time: parse_time,
+}
+
+
 def is_data_instance(cls: Type) -> bool:
     return getattr(cls, "__attrs_attrs__", None) is not None
 
@@ -85,8 +123,8 @@ def parse_value(cls: Type, raw: Any) -> Any:
     if is_data_instance(cls) and isinstance(raw, dict):
         return cls(**raw)
 
-    if cls in DATE_TYPES and isinstance(raw, str):
-        return datetime.fromisoformat(raw)
+    if isinstance(raw, str) and cls in DATE_PARSERS:
+        return DATE_PARSERS[cls](raw)
 
     if not hasattr(cls, "__origin__"):
         return raw
@@ -149,6 +187,13 @@ def as_dict(val: Any) -> Any:
     if isinstance(val, abc.Mapping):
         return parse_dict(val)
     if hasattr(val, "__dict__"):
+        if instrumentation.enabled and hasattr(val, "__jo__state__"):
+            start = time.perf_counter()
+            parsed = parse_dict(val.__dict__)
+            instrumentation.record(
+                type(val), instrumentation.SERIALIZE, time.perf_counter() - start
+            )
+            return parsed
         return parse_dict(val.__dict__)
 
     return val
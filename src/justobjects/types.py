@@ -1,8 +1,20 @@
+import copy
 import datetime
 import decimal
 import enum
 import logging
-from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import attr
 
@@ -26,9 +38,18 @@ def camel_case(snake_case: str) -> str:
     return cpnts[0] + "".join(x.title() for x in cpnts[1:])
 
 
+# number of attributes set on schemas, compiled coercers are checked again once it changed
+_schema_changes = 0
+
+
 class JustSchema:
     """A marker denoting a valid json schema data type"""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _schema_changes
+        _schema_changes += 1
+        object.__setattr__(self, name, value)
+
     def get_enclosed_type(self) -> "JustSchema":
         ...
 
@@ -38,7 +59,9 @@ class JustSchema:
         return transforms.parse_dict(self.__dict__)
 
     def coerce(self, value: Any) -> Any:
-        raise NotImplementedError(f"coercion not supported for {self.__class__}")
+        if converter_for(self.__class__) is None:
+            raise NotImplementedError(f"coercion not supported for {self.__class__}")
+        return cast(value, self)
 
     def validate(self, instance: Any) -> None:
         schema = self.as_dict()
@@ -190,14 +213,13 @@ class StringType(BasicType):
 
 @attr.s(auto_attribs=True)
 class DateTimeType(StringType):
-    """Date Time custom type"""
+    """Date Time custom type, accepts ISO 8601 strings and `datetime` objects"""
 
-    format: str = attr.ib(init=False, default="data-time")
+    format: str = attr.ib(init=False, default="date-time")
 
     def validate(self, instance: Any) -> None:
-        if isinstance(instance, datetime.datetime):
-            instance = instance.isoformat()
-        validation.validate(self.as_dict(), instance)
+        if not isinstance(instance, datetime.datetime):
+            coercer(self).check(instance)
 
     def coerce(self, value: Any) -> Any:
         return as_datetime(value, self)
@@ -205,12 +227,30 @@ class DateTimeType(StringType):
 
 @attr.s(auto_attribs=True)
 class TimeType(StringType):
+    """Time of day custom type, accepts ISO 8601 strings and `time` objects"""
+
     format: str = attr.ib(init=False, default="time")
 
+    def validate(self, instance: Any) -> None:
+        if not isinstance(instance, datetime.time):
+            coercer(self).check(instance)
+
+    def coerce(self, value: Any) -> Any:
+        return as_time(value, self)
+
 
 @attr.s(auto_attribs=True)
 class DateType(StringType):
-    format: str = attr.ib(init=False, default="data")
+    """Date custom type, accepts ISO 8601 strings and `date` objects"""
+
+    format: str = attr.ib(init=False, default="date")
+
+    def validate(self, instance: Any) -> None:
+        if not isinstance(instance, datetime.date):
+            coercer(self).check(instance)
+
+    def coerce(self, value: Any) -> Any:
+        return as_date(value, self)
 
 
 @attr.s(auto_attribs=True)
@@ -431,84 +471,272 @@ S = TypeVar("S", bound=JustSchema, contravariant=True)
 class Converter(typings.Protocol[S]):
     def __call__(
         self, value: Any, schema: Optional[S] = None
-    ) -> Union[bool, float, int, str, datetime.datetime, Iterable]:
+    ) -> Union[bool, float, int, str, datetime.date, datetime.time, Iterable]:
         ...
 
 
+@attr.s(auto_attribs=True, eq=False)
+class Coercer:
+    """Reusable coercion of values to a single schema
+
+    Holds the validator of the schema, built once, and a native check accepting the common valid
+    values without going through the validator.
+
+    Attributes:
+        schema: target schema
+        converter: conversion function of the schema type, None if coercion is not supported
+        validator: validator of the schema
+        accept: predicate accepting valid values, None if the schema has no native check
+        parse: conversion of the converter without the validation, None for converters
+            registered with `register_converter`
+    """
+
+    schema: JustSchema
+    converter: Optional[Converter]
+    validator: Any
+    accept: Optional[Callable[[Any], bool]] = None
+    parse: Optional[Callable[[Any], Any]] = None
+
+    def __call__(self, value: Any) -> Any:
+        if self.converter is None:
+            raise ValueError(f"Unknown converter for schema {self.schema}")
+        return self.converter(value, self.schema)
+
+    def check(self, value: Any) -> None:
+        """Validates an already converted value
+
+        Raises:
+            ValidationException
+        """
+        if self.accept is None or not self.accept(value):
+            validation.check(self.validator, value)
+
+
+# schema, value of _schema_changes when last checked, copy of the schema attributes when
+# compiled and the compiled coercer, keyed by the schema id
+_COERCERS: Dict[int, Tuple[JustSchema, int, Dict[str, Any], Coercer]] = {}
+
+
+def coercer(schema: JustSchema) -> Coercer:
+    """Compiles a schema into a reusable coercer, cached per schema instance
+
+    The coercer is compiled again when the attributes of the schema, or of the schemas nested in
+    it, were set to other values since it was cached
+
+    Examples:
+
+        >>> to_age = coercer(IntegerType(minimum=0))
+        >>> [to_age(v) for v in ["12", "42"]]
+        [12, 42]
+    """
+    entry = _COERCERS.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        if entry[1] == _schema_changes:
+            return entry[3]
+        if entry[2] == schema.__dict__:
+            _COERCERS[id(schema)] = (schema, _schema_changes, entry[2], entry[3])
+            return entry[3]
+
+    if len(_COERCERS) > 4096:
+        _COERCERS.clear()
+    schema_dict = schema.as_dict()
+    converter = converter_for(schema.__class__)
+    compiled = Coercer(
+        schema=schema,
+        converter=converter,
+        validator=validation.create_validator(schema_dict),
+        accept=validation.compile_scalar_check(schema_dict),
+        parse=_PARSERS.get(converter) if converter else None,
+    )
+    snapshot = copy.deepcopy(schema.__dict__)
+    _COERCERS[id(schema)] = (schema, _schema_changes, snapshot, compiled)
+    return compiled
+
+
 def as_array(value: Iterable, schema: Optional[ArrayType] = None) -> Iterable:
-    schema = schema or ArrayType(items=StringType())
-    return [cast(v, schema.items) for v in value]
+    schema = schema or DEFAULT_ARRAY
+    coerce = coercer(schema.items)
+    return [coerce(v) for v in value]
 
 
 def as_bool(value: Any, schema: Optional[BooleanType] = None) -> bool:
     """Parses value as boolean"""
 
-    schema = schema or BooleanType()
-    value = value.decode() if isinstance(value, bytes) else value
-    if value:
-        value = str(value).lower()
-        value = BOOLEANS.get(value)
-    validation.validate(schema.as_dict(), value)
+    value = _to_bool(value)
+    coercer(schema or DEFAULT_BOOLEAN).check(value)
     return value
 
 
+def as_date(value: Any, schema: Optional[DateType] = None) -> datetime.date:
+    if isinstance(value, datetime.date):
+        return _to_date(value)
+    schema = schema or DEFAULT_DATE
+    value = value.decode() if isinstance(value, bytes) else value
+    # the format check parses the string, the parsed value is then read from the parser cache
+    coercer(schema).check(value)
+    return transforms.parse_date(value)
+
+
 def as_datetime(value: Any, schema: Optional[DateTimeType] = None) -> datetime.datetime:
-    schema = schema or DateTimeType()
-    if isinstance(value, datetime.datetime):
-        value = value.isoformat()
-    validation.validate(schema.as_dict(), value)
-    return datetime.datetime.fromisoformat(value)
+    if isinstance(value, datetime.date):
+        return _to_datetime(value)
+    schema = schema or DEFAULT_DATETIME
+    value = value.decode() if isinstance(value, bytes) else value
+    coercer(schema).check(value)
+    return transforms.parse_datetime(value)
 
 
 def as_float(value: Any, schema: Optional[NumericType] = None) -> float:
-    schema = schema or NumericType()
-    try:
-        value = float(value)
-    except (ValueError, TypeError) as ve:
-        logger.debug(f"Error while coercing {value} to float")
-    validation.validate(schema.as_dict(), value)
+    value = _to_float(value)
+    coercer(schema or DEFAULT_NUMERIC).check(value)
     return value
 
 
 def as_int(value: Any, schema: Optional[IntegerType] = None) -> int:
-
-    schema = schema or IntegerType()
-    try:
-        value = int(value)
-    except (ValueError, TypeError) as ve:
-        logger.debug(f"Error while coercing {value} to int")
-    validation.validate(schema.as_dict(), value)
+    value = _to_int(value)
+    coercer(schema or DEFAULT_INTEGER).check(value)
     return value
 
 
 def as_string(value: Any, schema: Optional[StringType] = None) -> str:
+    value = _to_string(value)
+    coercer(schema or DEFAULT_STRING).check(value)
+    return value
+
+
+def as_time(value: Any, schema: Optional[TimeType] = None) -> datetime.time:
+    if isinstance(value, datetime.time):
+        return value
+    schema = schema or DEFAULT_TIME
+    value = value.decode() if isinstance(value, bytes) else value
+    coercer(schema).check(value)
+    return transforms.parse_time(value)
+
+
+# conversions of the built-in converters without the validation, invalid values are returned
+# unchanged so that a later validation reports them
+
+
+def _to_bool(value: Any) -> Any:
+    value = value.decode() if isinstance(value, bytes) else value
+    if value:
+        value = BOOLEANS.get(str(value).lower())
+    return value
+
+
+def _parse_with(parser: Callable[[str], Any], value: Any) -> Any:
+    value = value.decode() if isinstance(value, bytes) else value
+    try:
+        return parser(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _to_date(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return _parse_with(transforms.parse_date, value)
+
+
+def _to_datetime(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(value, datetime.time())
+    return _parse_with(transforms.parse_datetime, value)
+
 
-    schema = schema or StringType()
+def _to_float(value: Any) -> Any:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        logger.debug(f"Error while coercing {value} to float")
+        return value
+
+
+def _to_int(value: Any) -> Any:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        logger.debug(f"Error while coercing {value} to int")
+        return value
+
+
+def _to_string(value: Any) -> Any:
     if isinstance(value, (bytes, bytearray)):
         value = value.decode()
     if isinstance(value, (int, float, decimal.Decimal)):
         value = str(value)
     if isinstance(value, enum.Enum):
         value = value.value
-    validation.validate(schema.as_dict(), value)
     return value
 
 
+def _to_time(value: Any) -> Any:
+    if isinstance(value, datetime.time):
+        return value
+    return _parse_with(transforms.parse_time, value)
+
+
 def cast(data: Any, schema: JustSchema) -> Any:
-    converter = CONVERTERS.get(schema.__class__.__name__)
-    if not converter:
-        raise ValueError(f"Unknown converter for schema {schema}")
-    return converter(data, schema)
-
-
-CONVERTERS: Dict[str, Converter] = {
-    "ArrayType": as_array,
-    "BooleanType": as_bool,
-    "DateTimeType": as_datetime,
-    "EmailType": as_string,
-    "HostnameType": as_string,
-    "IntegerType": as_int,
-    "NumericType": as_float,
-    "StringType": as_string,
-    "UuidType": as_string,
+    return coercer(schema)(data)
+
+
+CONVERTERS: Dict[Type[JustSchema], Converter] = {
+    ArrayType: as_array,
+    BooleanType: as_bool,
+    DateTimeType: as_datetime,
+    DateType: as_date,
+    IntegerType: as_int,
+    NumericType: as_float,
+    StringType: as_string,
+    TimeType: as_time,
+}
+_RESOLVED: Dict[Type[JustSchema], Optional[Converter]] = {}
+_PARSERS: Dict[Converter, Callable[[Any], Any]] = {
+    as_bool: _to_bool,
+    as_date: _to_date,
+    as_datetime: _to_datetime,
+    as_float: _to_float,
+    as_int: _to_int,
+    as_string: _to_string,
+    as_time: _to_time,
 }
+
+
+def converter_for(schema_type: Type[JustSchema]) -> Optional[Converter]:
+    """Finds the converter of a schema type, or of its closest registered parent type"""
+
+    try:
+        return _RESOLVED[schema_type]
+    except KeyError:
+        pass
+    converter = next((CONVERTERS[t] for t in schema_type.__mro__ if t in CONVERTERS), None)
+    _RESOLVED[schema_type] = converter
+    return converter
+
+
+def register_converter(schema_type: Type[JustSchema], converter: Converter) -> None:
+    """Registers the converter used to coerce values of a schema type and its subtypes
+
+    Examples:
+
+        >>> register_converter(PortType, as_port)
+        >>> cast("8080", PortType())
+        8080
+    """
+    CONVERTERS[schema_type] = converter
+    _RESOLVED.clear()
+    _COERCERS.clear()
+
+
+DEFAULT_ARRAY = ArrayType(items=StringType())
+DEFAULT_BOOLEAN = BooleanType()
+DEFAULT_DATE = DateType()
+DEFAULT_DATETIME = DateTimeType()
+DEFAULT_INTEGER = IntegerType()
+DEFAULT_NUMERIC = NumericType()
+DEFAULT_STRING = StringType()
+DEFAULT_TIME = TimeType()
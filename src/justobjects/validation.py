@@ -1,33 +1,500 @@
-from typing import Any, Dict, List, Union
+import abc
+import functools
+import operator
+import re
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 import attr
 import validators
-from jsonschema import Draft7Validator, FormatChecker, FormatError
+from jsonschema import Draft7Validator, FormatChecker, FormatError, exceptions
+from jsonschema.validators import extend
 
+from justobjects import profiling, transforms, typings
 
-@attr.s(frozen=True, auto_attribs=True)
+
+@functools.total_ordering
 class ValidationError:
     """Data object representation for validation errors
 
+    Errors created from a validation keep the raw path of the affected element, the dotted
+    `element` name is only rendered when first accessed. Errors are immutable, they compare,
+    order and hash by element and message.
+
     Attributes:
         element (str): name of the affected column, can be empty
         message (str): associated error message
     """
 
-    element: str
+    __slots__ = ("_path", "_element", "message")
+
+    _path: Optional[Tuple[Any, ...]]
+    _element: Optional[str]
     message: str
 
+    def __init__(self, element: str, message: str) -> None:
+        object.__setattr__(self, "_path", None)
+        object.__setattr__(self, "_element", element)
+        object.__setattr__(self, "message", message)
+
+    @classmethod
+    def from_path(cls, path: Iterable[Any], message: str) -> "ValidationError":
+        error = cls.__new__(cls)
+        object.__setattr__(error, "_path", tuple(path))
+        object.__setattr__(error, "_element", None)
+        object.__setattr__(error, "message", message)
+        return error
+
+    @property
+    def element(self) -> str:
+        element = self._element
+        if element is None:
+            element = ".".join([str(entry) for entry in self._path or ()])
+            object.__setattr__(self, "_element", element)
+        return element
+
+    @property
+    def path(self) -> Tuple[Any, ...]:
+        """Path of the affected element"""
+
+        if self._path is not None:
+            return self._path
+        return tuple(self.element.split(".")) if self.element else ()
+
+    def _key(self) -> Tuple[str, str]:
+        return self.element, self.message
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __lt__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() < other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"ValidationError(element={self.element!r}, message={self.message!r})"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise attr.exceptions.FrozenInstanceError()
+
+    def __delattr__(self, name: str) -> None:
+        raise attr.exceptions.FrozenInstanceError()
+
+    def __reduce__(self) -> Any:
+        return ValidationError.from_path, (self.path, self.message)
+
+
+def parse_errors(validator: "Validator", instance: Dict) -> List[ValidationError]:
+    return [ValidationError.from_path(e.path, e.message) for e in validator.iter_errors(instance)]
+
+
+def _canonical(value: Any) -> Any:
+    """Converts a json value into a hashable key, equal json values get equal keys
+
+    Booleans are kept apart from 1 and 0, arrays and tuples are interchangeable and objects are
+    compared regardless of key order.
+    """
+    if value is True or value is False:
+        return bool, value
+    if isinstance(value, (list, tuple)):
+        return list, tuple(_canonical(item) for item in value)
+    if isinstance(value, dict):
+        return dict, frozenset((key, _canonical(item)) for key, item in value.items())
+    hash(value)
+    return value
+
+
+def is_unique(items: Iterable[Any]) -> bool:
+    """Checks that all array items are distinct in linear time
+
+    Items are hashed through their canonical form, values that cannot be hashed are compared
+    with each other pairwise.
+    """
+    seen = set()
+    unhashable: List[Any] = []
+    for item in items:
+        try:
+            key = _canonical(item)
+        except TypeError:
+            if any(item == other for other in unhashable):
+                return False
+            unhashable.append(item)
+            continue
+        if key in seen:
+            return False
+        seen.add(key)
+    return True
+
+
+def unique_items(validator: Any, unique: bool, instance: Any, schema: Dict) -> Iterable[Any]:
+    if unique and validator.is_type(instance, "array") and not is_unique(instance):
+        yield exceptions.ValidationError(f"{instance!r} has non-unique elements")
+
+
+SCALAR_KEYWORDS = {
+    "$comment",
+    "default",
+    "description",
+    "enum",
+    "exclusiveMaximum",
+    "exclusiveMinimum",
+    "maxLength",
+    "maximum",
+    "minLength",
+    "minimum",
+    "pattern",
+    "title",
+    "type",
+}
+SCALAR_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "boolean": lambda v: v.__class__ is bool,
+    "integer": lambda v: v.__class__ is int or (v.__class__ is float and v.is_integer()),
+    "number": lambda v: v.__class__ is int or v.__class__ is float,
+    "string": lambda v: v.__class__ is str,
+}
+# bounds by the scalar types they apply to, other types ignore them
+SCALAR_BOUNDS: Dict[str, Tuple[Callable[[Any, Any], bool], bool, FrozenSet[str]]] = {
+    "minimum": (operator.ge, False, frozenset({"integer", "number"})),
+    "maximum": (operator.le, False, frozenset({"integer", "number"})),
+    "exclusiveMinimum": (operator.gt, False, frozenset({"integer", "number"})),
+    "exclusiveMaximum": (operator.lt, False, frozenset({"integer", "number"})),
+    "minLength": (operator.ge, True, frozenset({"string"})),
+    "maxLength": (operator.le, True, frozenset({"string"})),
+}
+_SCALAR_CHECKS: Dict[int, Tuple[Dict, Optional[Callable[[Any], bool]]]] = {}
+
+
+def _bound_check(op: Callable[[Any, Any], bool], bound: Any, size: bool) -> Callable[[Any], bool]:
+    if size:
+        return lambda v: op(len(v), bound)
+    return lambda v: op(v, bound)
+
+
+def compile_scalar_check(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """Compiles a schema made up of a single scalar type and simple bounds into a predicate
+
+    The predicate may reject valid values, these are handed back to the full validator, but
+    never accepts invalid ones. Returns None when the schema uses any other keyword, or a
+    keyword that does not apply to its type.
+    """
+    if not SCALAR_KEYWORDS.issuperset(schema) or schema.get("type") not in SCALAR_TYPES:
+        return None
+
+    checks: List[Callable[[Any], bool]] = [SCALAR_TYPES[schema["type"]]]
+    for keyword, (op, size, applies) in SCALAR_BOUNDS.items():
+        if keyword in schema:
+            if schema["type"] not in applies:
+                return None
+            checks.append(_bound_check(op, schema[keyword], size))
+    if "pattern" in schema:
+        if schema["type"] != "string":
+            return None
+        regex = re.compile(schema["pattern"])
+        checks.append(lambda v: regex.search(v) is not None)
+    if "enum" in schema:
+        if not all(isinstance(e, str) for e in schema["enum"]) or schema["type"] != "string":
+            return None
+        enums = frozenset(schema["enum"])
+        checks.append(lambda v: v in enums)
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda v: all(check(v) for check in checks)
+
+
+def _scalar_check(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    entry = _SCALAR_CHECKS.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        if len(_SCALAR_CHECKS) > 4096:
+            _SCALAR_CHECKS.clear()
+        entry = _SCALAR_CHECKS[id(schema)] = (schema, compile_scalar_check(schema))
+    return entry[1]
+
+
+def prepare(schema: Any) -> None:
+    """Compiles the regular expressions and array item checks of a json schema ahead of its
+    first validation"""
+
+    if isinstance(schema, list):
+        for entry in schema:
+            prepare(entry)
+    if not isinstance(schema, dict):
+        return
+    if isinstance(schema.get("pattern"), str):
+        re.compile(schema["pattern"])
+    for pattern in schema.get("patternProperties") or ():
+        re.compile(pattern)
+    if isinstance(schema.get("items"), dict):
+        _scalar_check(schema["items"])
+    for value in schema.values():
+        if isinstance(value, (dict, list)):
+            prepare(value)
+
+
+_draft7_items = Draft7Validator.VALIDATORS["items"]
+
+
+def items(validator: Any, items_schema: Any, instance: Any, schema: Dict) -> Iterable[Any]:
+    """Draft7 `items` keyword with a fast path for arrays of scalar values
+
+    Homogeneous arrays are checked in a single loop, only the failing items are validated with
+    the full validator to produce the detailed errors.
+    """
+    check = _scalar_check(items_schema) if isinstance(items_schema, dict) else None
+    if check is None or not validator.is_type(instance, "array"):
+        yield from _draft7_items(validator, items_schema, instance, schema) or ()
+        return
+
+    if all(map(check, instance)):
+        return
+    for index, item in enumerate(instance):
+        if not check(item):
+            yield from validator.descend(item, items_schema, path=index)
+
+
+JustObjectsValidator = extend(
+    Draft7Validator, validators={"items": items, "uniqueItems": unique_items}
+)
+
+
+class Validator(typings.Protocol):
+    def iter_errors(self, instance: Any) -> Iterable[Any]:
+        ...
+
+
+class Backend(abc.ABC):
+    """Validation engine compiling json schemas into reusable validators
+
+    Validators yield errors exposing the `path` of the failing element, the error `message` and
+    the failing `validator` keyword, the same way `jsonschema` errors do. This keeps the reported
+    `ValidationError` lists identical whichever backend is used.
+
+    Example:
+        .. code-block:: python
+
+            from justobjects import validation
+
+            class FastBackend(validation.Backend):
+                name = "fast"
+
+                def compile(self, schema):
+                    ...
+
+            validation.register_backend(FastBackend())
+            validation.use_backend("fast")  # or per model with @jo.data(backend="fast")
+    """
+
+    name = ""
 
-def parse_errors(validator: Draft7Validator, instance: Dict) -> List[ValidationError]:
-    errors: List[ValidationError] = []
-    for e in validator.iter_errors(instance):
-        str_path = ".".join([str(entry) for entry in e.path])
-        errors.append(ValidationError(str_path, e.message))
-    return errors
+    @abc.abstractmethod
+    def compile(self, schema: Dict[str, Any]) -> Validator:
+        """Compiles a json schema into a validator"""
 
 
-def validate(schema: Dict[str, Any], instance: Any) -> None:
+class JsonSchemaBackend(Backend):
+    """Draft 7 validators of the `jsonschema` library, the default backend"""
+
+    name = "jsonschema"
+
+    def compile(self, schema: Dict[str, Any]) -> Validator:
+        return JustObjectsValidator(schema=schema, format_checker=JustObjectFormatChecker())
+
+
+BACKENDS: Dict[str, Backend] = {}
+_default_backend = JsonSchemaBackend.name
+
+
+def register_backend(backend: Backend) -> None:
+    BACKENDS[backend.name] = backend
+
+
+def use_backend(name: str) -> None:
+    """Selects the backend used by data objects and schemas that do not set one
+
+    Validators already compiled keep their backend, select the backend before the data objects
+    are first used.
+    """
+    global _default_backend
+    get_backend(name)
+    _default_backend = name
+
+
+def get_backend(backend: Union[str, Backend, None] = None) -> Backend:
+    """Resolves a backend instance or name, defaults to the globally selected backend"""
+
+    if isinstance(backend, Backend):
+        return backend
+    name = backend or _default_backend
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown validation backend {name}") from None
+
+
+register_backend(JsonSchemaBackend())
+
+
+def create_validator(
+    schema: Dict[str, Any], backend: Union[str, Backend, None] = None
+) -> Validator:
+    """Creates a reusable validator for the given json schema
+
+    Args:
+        schema: json schema
+        backend: backend instance or name, defaults to the globally selected backend
+    """
+    return get_backend(backend).compile(schema)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Limits:
+    """Bounds enforced on untrusted payloads before and during schema validation
+
+    Attributes:
+        max_depth: maximum nesting level of objects and arrays
+        max_array_length: maximum number of items in any array
+        max_nodes: maximum number of values in the whole payload
+        timeout: wall clock budget of the validation in seconds
+    """
+
+    max_depth: Optional[int] = None
+    max_array_length: Optional[int] = None
+    max_nodes: Optional[int] = None
+    timeout: Optional[float] = None
+
+
+def _path_element(path: Tuple[Any, ...]) -> str:
+    return ".".join([str(entry) for entry in path])
+
+
+def check_limits(instance: Any, limits: Limits, deadline: Optional[float] = None) -> None:
+    """Walks a payload and fails on the first structural limit it exceeds
+
+    Args:
+        instance: payload to check
+        limits: bounds to enforce
+        deadline: optional `time.monotonic` value after which the walk is aborted
+    Raises:
+        ValidationLimitExceeded
+    """
+    nodes = 0
+    stack: List[Tuple[Any, int, Tuple[Any, ...]]] = [(instance, 0, ())]
+    while stack:
+        value, depth, path = stack.pop()
+        nodes += 1
+        if limits.max_nodes is not None and nodes > limits.max_nodes:
+            raise ValidationLimitExceeded(
+                _path_element(path), f"payload exceeds the maximum of {limits.max_nodes} values"
+            )
+        if deadline is not None and nodes % 1024 == 0 and time.monotonic() > deadline:
+            raise ValidationLimitExceeded("", f"validation exceeded {limits.timeout}s")
+
+        if isinstance(value, dict):
+            children: Iterable[Tuple[Any, Any]] = value.items()
+        elif isinstance(value, (list, tuple, set)):
+            if limits.max_array_length is not None and len(value) > limits.max_array_length:
+                raise ValidationLimitExceeded(
+                    _path_element(path),
+                    f"array of {len(value)} items exceeds the maximum length of "
+                    f"{limits.max_array_length}",
+                )
+            children = enumerate(value)
+        else:
+            continue
+
+        if limits.max_depth is not None and depth >= limits.max_depth:
+            raise ValidationLimitExceeded(
+                _path_element(path), f"payload exceeds the maximum depth of {limits.max_depth}"
+            )
+        stack.extend((child, depth + 1, path + (key,)) for key, child in children)
+
+
+_budget = threading.local()
+_BUDGETED: Dict[Type[Draft7Validator], Type[Draft7Validator]] = {}
+
+
+def _budgeted(fn: Callable) -> Callable:
+    def budgeted(validator: Any, value: Any, instance: Any, schema: Any) -> Any:
+        deadline = getattr(_budget, "deadline", None)
+        if deadline is not None and time.monotonic() > deadline:
+            raise ValidationLimitExceeded("", f"validation exceeded {_budget.timeout}s")
+        return fn(validator, value, instance, schema)
+
+    return budgeted
+
+
+def _budgeted_validator(validator: Any) -> Validator:
+    base = type(validator)
+    budgeted_cls = _BUDGETED.get(base)
+    if budgeted_cls is None:
+        keywords = {kw: _budgeted(fn) for kw, fn in base.VALIDATORS.items()}
+        budgeted_cls = _BUDGETED[base] = extend(base, validators=keywords)
+    return budgeted_cls(validator.schema, format_checker=validator.format_checker)
+
+
+def _profiled(validator: Any) -> Validator:
+    # profiling and time budgets hook into keywords, only supported by jsonschema validators
+    active_profile = profiling.active()
+    if active_profile is not None and hasattr(validator, "VALIDATORS"):
+        return active_profile.instrument(validator)
+    return validator
+
+
+def check(validator: Validator, instance: Any, limits: Optional[Limits] = None) -> None:
+    """Validates an instance with a pre-built validator
+
+    Args:
+        validator: compiled validator
+        instance: data to validate
+        limits: optional bounds checked before the schema validation
+    Raises:
+        ValidationException
+    """
+    if limits is None:
+        errors: List[ValidationError] = parse_errors(_profiled(validator), instance)
+    else:
+        errors = _check_within_limits(validator, instance, limits)
+    if errors:
+        raise ValidationException(errors=errors)
+
+
+def _check_within_limits(
+    validator: Validator, instance: Any, limits: Limits
+) -> List[ValidationError]:
+    deadline = None if limits.timeout is None else time.monotonic() + limits.timeout
+    check_limits(instance, limits, deadline)
+    if deadline is None or not hasattr(validator, "VALIDATORS"):
+        return parse_errors(_profiled(validator), instance)
+
+    previous = getattr(_budget, "deadline", None), getattr(_budget, "timeout", None)
+    _budget.deadline, _budget.timeout = deadline, limits.timeout
+    try:
+        # budgeted before profiling, the budgeted classes are cached per validator class
+        return parse_errors(_profiled(_budgeted_validator(validator)), instance)
+    finally:
+        _budget.deadline, _budget.timeout = previous
+
+
+def validate(schema: Dict[str, Any], instance: Any, limits: Optional[Limits] = None) -> None:
     """Validates if a data sample is valid for the given data object type
 
     This is best suited for validating existing json data without having to creating instances of
@@ -48,15 +515,12 @@ def validate(schema: Dict[str, Any], instance: Any) -> None:
     Args:
         schema: data object type with schema defined
         instance: dictionary or list of data instances that needs to be validated
+        limits: optional bounds for untrusted payloads
     Raises:
         ValidationException
 
     """
-    validator = Draft7Validator(schema=schema, format_checker=JustObjectFormatChecker())
-
-    errors: List[ValidationError] = parse_errors(validator, instance)
-    if errors:
-        raise ValidationException(errors=errors)
+    check(create_validator(schema), instance, limits)
 
 
 class ValidationException(Exception):
@@ -67,9 +531,24 @@ class ValidationException(Exception):
     """
 
     def __init__(self, errors: List[ValidationError]):
-        super(ValidationException, self).__init__(f"Data validation error: {errors}")
+        # the message is rendered on demand, rejected payloads are often never reported
+        super(ValidationException, self).__init__(errors)
         self.errors = errors
 
+    def __str__(self) -> str:
+        return f"Data validation error: {self.errors}"
+
+
+class ValidationLimitExceeded(ValidationException):
+    """Raised when an untrusted payload exceeds the configured validation `Limits`"""
+
+    def __init__(self, element: str, message: str):
+        super(ValidationLimitExceeded, self).__init__([ValidationError(element, message)])
+
+    def __reduce__(self) -> Any:
+        error = self.errors[0]
+        return ValidationLimitExceeded, (error.element, error.message)
+
 
 def is_uuid(instance: Union[str, bytes]) -> bool:
     if not isinstance(instance, (str, bytes)):
@@ -97,10 +576,13 @@ class JustObjectFormatChecker(FormatChecker):
 
 
 CHECKER_FACTORY = {
+    "date": transforms.parse_date,
+    "date-time": transforms.parse_datetime,
     "email": validators.email,
     "hostname": validators.domain,
     "ipv4": validators.ipv4,
     "ipv6": validators.ipv6,
+    "time": transforms.parse_time,
     "uri": validators.url,
     "uuid": validators.uuid,
 }
@@ -0,0 +1,141 @@
+import multiprocessing
+import pickle
+import subprocess
+import sys
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import pytest
+
+from justobjects import binary
+from justobjects.batches import SharedBatch
+from tests.models import Actor, Role
+
+actors = [
+    Actor(name=f"actor{i}", sex="f", role=Role(name="lead", race="elf"), age=i, height=1.5)
+    for i in range(50)
+]
+
+
+def total_age(batch: SharedBatch[Actor]) -> int:
+    with batch:
+        return sum(actor.age for actor in batch)
+
+
+def test_create_and_read() -> None:
+    with SharedBatch.create(Actor, actors) as batch:
+        assert len(batch) == 50
+        assert list(batch) == actors
+        assert batch[-1] == actors[-1]
+        assert batch[10:13] == actors[10:13]
+        with pytest.raises(IndexError):
+            batch[50]
+
+
+def test_attach_by_name() -> None:
+    with SharedBatch.create(Actor, actors) as batch:
+        with SharedBatch.attach(Actor, batch.name) as attached:
+            assert attached[7] == actors[7]
+        with pytest.raises(binary.BinaryFormatError):
+            SharedBatch.attach(Role, batch.name)
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=batch.name)
+
+
+def test_empty_batch() -> None:
+    with SharedBatch.create(Actor, []) as batch:
+        assert len(batch) == 0
+        assert list(batch) == []
+
+
+def test_pickles_segment_name() -> None:
+    with SharedBatch.create(Actor, actors) as batch:
+        payload = pickle.dumps(batch)
+        assert len(payload) < 200
+        with pickle.loads(payload) as attached:
+            assert attached[3] == actors[3]
+
+
+def test_process_workers() -> None:
+    with SharedBatch.create(Actor, actors) as batch:
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            assert pool.map(total_age, [batch, batch]) == [sum(range(50))] * 2
+
+
+ROOT = Path(__file__).parents[2]
+
+ATTACH = """
+import sys
+
+from justobjects.batches import SharedBatch
+from tests.models import Actor
+
+with SharedBatch.attach(Actor, sys.argv[1]) as batch:
+    print(batch[3].name)
+"""
+
+OWNER = """
+import multiprocessing
+import subprocess
+import sys
+
+from justobjects.batches import SharedBatch
+from tests.models import Actor
+from tests.unit.test_batches import ATTACH, actors, total_age
+
+if __name__ == "__main__":
+    with SharedBatch.create(Actor, actors) as batch:
+        if sys.argv[1] == "process":
+            attached = subprocess.run(
+                [sys.executable, "-c", ATTACH, batch.name], capture_output=True, text=True
+            )
+            assert attached.stdout == "actor3\\n", attached.stderr
+        elif sys.argv[1] == "pool":
+            with multiprocessing.get_context("spawn").Pool(1) as pool:
+                assert pool.map(total_age, [batch]) == [sum(range(50))]
+        else:
+            with SharedBatch.attach(Actor, batch.name) as again:
+                assert again[3] == actors[3]
+"""
+
+UNLINK = """
+import sys
+from multiprocessing import shared_memory
+
+shared_memory.SharedMemory(name=sys.argv[1]).unlink()
+"""
+
+
+def test_attaching_processes_leave_the_segment() -> None:
+    with SharedBatch.create(Actor, actors) as batch:
+        for _ in range(2):
+            attached = subprocess.run(
+                [sys.executable, "-c", ATTACH, batch.name],
+                cwd=ROOT,
+                capture_output=True,
+                text=True,
+            )
+            assert attached.stdout == "actor3\n"
+            assert attached.stderr == ""
+        with SharedBatch.attach(Actor, batch.name) as again:
+            assert again[3] == actors[3]
+
+
+@pytest.mark.parametrize("attach", ["process", "pool", "owner"])
+def test_owner_keeps_tracking_the_segment(attach: str) -> None:
+    owner = subprocess.run(
+        [sys.executable, "-c", OWNER, attach],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert owner.returncode == 0, owner.stderr
+    assert "resource_tracker" not in owner.stderr
+
+
+def test_close_tolerates_removed_segment() -> None:
+    batch = SharedBatch.create(Actor, actors)
+    subprocess.run([sys.executable, "-c", UNLINK, batch.name], check=True)
+    batch.close()
+    assert not batch.owner
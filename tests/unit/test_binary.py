@@ -0,0 +1,84 @@
+import json
+from typing import Any, Optional, Type
+
+import pytest
+
+import justobjects as jo
+from justobjects import binary, schemas
+from tests.models import Actor, Manager, Movie, Role, RoleManager
+
+actor = Actor(name="Ann", sex="f", role=Role(name="lead", race="elf"), age=-30, height=1.5)
+
+
+@jo.data(typed=True)
+class Counter:
+    value: int
+    label: Optional[str] = None
+
+
+def test_round_trip() -> None:
+    manager = Manager(
+        actors=[actor] * 20, movies=[Movie(main=actor, title="Dune")], personal={"ann": actor}
+    )
+    payload = manager.to_binary()
+
+    assert Manager.from_binary(payload) == manager
+    assert len(payload) * 3 < len(json.dumps(manager.as_dict()))
+
+
+def test_round_trip_json_fields() -> None:
+    manager = RoleManager(
+        roles=[actor.role], allowed=[actor.role], people=actor, names=3, requires="no"
+    )
+
+    restored = RoleManager.from_binary(manager.to_binary())
+
+    assert restored == manager
+    assert isinstance(restored.people, Actor)
+
+
+@pytest.mark.parametrize("counter", [Counter(value=2**70), Counter(value=-1, label="é")])
+def test_round_trip_values(counter: Counter) -> None:
+    assert Counter.from_binary(counter.to_binary()) == counter
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"",
+        b"JO\x01" + bytes(8),
+        Role(name="a", race="b").to_binary(),
+        actor.to_binary()[:-3],
+        actor.to_binary() + b"\x00",
+    ],
+)
+def test_rejects_foreign_payloads(payload: Any) -> None:
+    with pytest.raises(binary.BinaryFormatError):
+        Actor.from_binary(payload)
+
+
+def make_cast(name_type: Type, doc: str) -> Any:
+    @jo.data(typed=True)
+    class Crew:
+        name: name_type  # type: ignore
+
+    @jo.data(typed=True)
+    class Cast:
+        __doc__ = doc
+        lead: Crew
+        extras: Optional[Crew] = None
+
+    return Cast
+
+
+def test_header_only_depends_on_the_layout() -> None:
+    first = make_cast(str, "A cast")
+    second = make_cast(str, "The cast of a movie")
+    other = make_cast(int, "A cast")
+
+    crews = [first.__attrs_attrs__.lead.type, second.__attrs_attrs__.lead.type]
+    assert len({schemas.JUST_OBJECTS.definition_name(crew) for crew in crews}) == 2
+    assert binary.header(first) == binary.header(second)
+    assert binary.header(first) != binary.header(other)
+    payload = first(lead={"name": "Ann"}).to_binary()
+    assert second.from_binary(payload) == second(lead={"name": "Ann"})
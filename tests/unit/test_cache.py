@@ -0,0 +1,75 @@
+import json
+import warnings
+from pathlib import Path
+from typing import Any, Iterator, Type
+
+import pytest
+
+import justobjects as jo
+from justobjects import cache, schemas
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Iterator[Path]:
+    cache.enable(tmp_path)
+    yield tmp_path
+    cache.disable()
+
+
+def make_model(field_type: Type) -> Type:
+    # created like a module level class, classes defined in functions are not cached
+    namespace = {"__annotations__": {"value": field_type}, "__qualname__": "Cached"}
+    return jo.data(typed=True)(type("Cached", (), namespace))
+
+
+def make_local_model(field_type: Type) -> Type:
+    @jo.data(typed=True)
+    class Tenant:
+        value: field_type  # type: ignore
+
+    return Tenant
+
+
+def test_schema_is_written_to_cache(cache_dir: Path) -> None:
+    model = make_model(int)
+    entries = list(cache_dir.glob("*Cached.json"))
+
+    assert len(entries) == 1
+    entry = json.loads(entries[0].read_text())
+    assert entry["fingerprint"] == schemas.fingerprint(model)
+    assert entry["schema"] == jo.show_schema(model)
+
+
+def test_schema_is_loaded_from_cache(cache_dir: Path) -> None:
+    make_model(int)
+    model = make_model(int)
+
+    assert schemas._state(model).schema is None
+    assert jo.show_schema(model)["properties"]["value"]["type"] == "integer"
+    with pytest.raises(jo.ValidationException):
+        model(value="one")
+
+
+def test_stale_cache_warns(cache_dir: Path) -> None:
+    make_model(int)
+    with pytest.warns(cache.StaleCacheWarning):
+        model = make_model(str)
+
+    assert jo.show_schema(model)["properties"]["value"]["type"] == "string"
+
+
+def test_schema_format_change_invalidates_cache(cache_dir: Path, monkeypatch: Any) -> None:
+    make_model(int)
+    monkeypatch.setattr(schemas, "SCHEMA_FORMAT", schemas.SCHEMA_FORMAT + 1)
+
+    with pytest.warns(cache.StaleCacheWarning):
+        make_model(int)
+
+
+def test_local_classes_are_not_cached(cache_dir: Path) -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", cache.StaleCacheWarning)
+        models = [make_local_model(field_type) for field_type in (int, str, int, bool)]
+
+    assert list(cache_dir.iterdir()) == []
+    assert jo.show_schema(models[1])["properties"]["value"]["type"] == "string"
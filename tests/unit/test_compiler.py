@@ -0,0 +1,116 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from justobjects import compiler
+
+MODELS = """
+import justobjects as jo
+
+
+@jo.data(typed=True)
+class Crew:
+    name: str
+
+
+@jo.data(typed=True)
+class Ship:
+    name: str
+    crew: Crew
+    decks: int = 1
+"""
+
+CHECK = """
+import warnings
+
+import justobjects as jo
+from justobjects import cache, schemas
+
+warnings.simplefilter("error", cache.StaleCacheWarning)
+from {package}.models import Ship
+
+assert schemas._state(Ship).schema is None
+assert jo.show_schema(Ship)["definitions"]["Crew"]["required"] == ["name"]
+try:
+    Ship(name="Argo", crew={{"name": "Jason"}}, decks="two")
+except jo.ValidationException as e:
+    print(e.errors[0].element)
+"""
+
+
+def run(code: str, cwd: Path) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Path:
+    package = tmp_path / "fleet"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "models.py").write_text(MODELS)
+    return package
+
+
+def test_compiled_schemas_are_loaded(package: Path) -> None:
+    output = package / "_jo_compiled.py"
+    compile_cmd = (
+        "from justobjects.__main__ import main; main(['compile', 'fleet.models', '-o', %r])"
+    )
+    assert (
+        run(compile_cmd % str(output), package.parent) == f"Compiled 2 data objects to {output}"
+    )
+
+    assert run(CHECK.format(package="fleet"), package.parent) == "decks"
+
+
+def test_stale_compiled_schemas_are_ignored(package: Path) -> None:
+    output = package / "_jo_compiled.py"
+    compile_cmd = "from justobjects.__main__ import main; main(['compile', 'fleet', '-o', %r])"
+    run(compile_cmd % str(output), package.parent)
+    (package / "models.py").write_text(MODELS.replace("decks: int = 1", "decks: str = '1'"))
+
+    check = """
+import warnings
+
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter("always")
+    from fleet.models import Ship
+
+print(*{w.category.__name__ for w in caught if w.category.__module__ == "justobjects.cache"})
+assert Ship.__jo__()["properties"]["decks"]["type"] == "string"
+"""
+    assert run(check, package.parent) == "StaleCacheWarning"
+
+
+def test_render_keeps_values_and_order() -> None:
+    entries = {
+        "fleet.Ship": {
+            "fingerprint": "abc",
+            "schema": {
+                "type": "object",
+                "properties": {"name": {"default": '\\"""', "pattern": "^\\d+$"}},
+                "additionalProperties": False,
+                "description": "Schiff \u2693",
+                "examples": [None, True, 1.5],
+            },
+            "definition": {},
+        }
+    }
+
+    namespace: Dict[str, Any] = {}
+    exec(compiler.render(entries), namespace)
+    assert namespace["SCHEMAS"] == entries
+    assert list(namespace["SCHEMAS"]["fleet.Ship"]["schema"]) == list(
+        entries["fleet.Ship"]["schema"]
+    )
@@ -1,8 +1,12 @@
-from typing import Set
+import gc
+import typing
+import weakref
+from typing import Dict, List, Optional, Set, Type
 
 import pytest
 
 import justobjects as jo
+from justobjects import schemas
 
 
 @jo.data(typed=True)
@@ -40,3 +44,68 @@ def test_validation() -> None:
         jo.validate(qn)
     ve = v.value.errors[0]
     assert ve.element == "value"
+
+
+def test_definitions_are_shared() -> None:
+    schema = jo.show_schema(Example)
+
+    assert schema["definitions"]["Answer"] == jo.show_schema(Question)["definitions"]["Answer"]
+    assert "Question" in schema["definitions"]
+
+
+def test_shown_schemas_are_copies() -> None:
+    jo.show_schema(Question).pop("definitions")
+    jo.show_schema(List[Question])["definitions"]["Answer"]["properties"].clear()
+
+    assert "value" in jo.show_schema(Question)["definitions"]["Answer"]["properties"]
+    assert Question(position=1, answer=Answer(value="yes")).position == 1
+
+
+def test_show_generic_schema_with_definitions() -> None:
+    schema = jo.show_schema(List[Question])
+
+    assert schema["items"]["$ref"] == "#/definitions/Question"
+    assert set(schema["definitions"]) == {"Answer", "Question"}
+
+
+def test_generic_schemas_are_memoized() -> None:
+    assert schemas.transform(Optional[Answer]) is schemas.transform(Optional[Answer])
+    assert schemas._show_typed_container(List[Answer]) is schemas._show_typed_container(
+        List[Answer]
+    )
+    jo.show_schema(List[Answer])["minItems"] = 99
+    assert jo.show_schema(List[Answer])["minItems"] == 1
+
+
+def redefine_answer() -> Type:
+    @jo.data(typed=True)
+    class Answer:
+        label: str
+
+    return Answer
+
+
+def test_generic_schemas_of_redefined_models() -> None:
+    original = jo.show_schema(Dict[str, Answer])
+
+    answer = redefine_answer()
+    redefined = jo.show_schema(Dict[str, answer])  # type: ignore
+    name = schemas.JUST_OBJECTS.definition_name(answer)
+    assert name != "Answer"
+    assert "label" in redefined["definitions"][name]["properties"]
+    assert jo.show_schema(Dict[str, Answer]) == original
+
+
+def test_generic_schemas_do_not_keep_models_alive() -> None:
+    answers = [redefine_answer() for _ in range(5)]
+    for answer in answers:
+        jo.show_schema(List[answer])  # type: ignore
+        schemas.transform(Optional[answer])
+    refs = [weakref.ref(answer) for answer in answers]
+    del answers, answer
+
+    # typing memoizes the latest aliases as well
+    for cleanup in typing._cleanups:  # type: ignore
+        cleanup()
+    gc.collect()
+    assert all(ref() is None for ref in refs)
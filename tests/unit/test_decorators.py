@@ -1,8 +1,15 @@
+import copy
+import gc
 import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
 
 import pytest
 
+import justobjects as jo
 from justobjects import schemas, validation
+from tests import models
 from tests.models import Actor, Manager, Movie, Role, RoleManager, Unknown
 
 
@@ -101,5 +108,116 @@ def test_complex_object():
         assert role.name
 
 
+def test_lazy_model_builds_on_first_use(monkeypatch: Any) -> None:
+    built: List[Any] = []
+    build_schema = schemas.build_schema
+
+    def counting_build(cls: Any) -> schemas.SchemaType:
+        built.append(cls)
+        return build_schema(cls)
+
+    monkeypatch.setattr(schemas, "build_schema", counting_build)
+
+    @jo.data(typed=True, lazy=True)
+    class Lazy:
+        role: Role
+        rank: int = 1
+
+    assert built == []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: jo.show_schema(Lazy), range(16)))
+
+    assert built == [Lazy]
+    assert all(result == results[0] for result in results)
+    assert Lazy(role=Role(name="Nick Fury", race="black")).rank == 1
+
+
+def make_tenant(field: str) -> Any:
+    @jo.data(typed=True)
+    class Tenant:
+        __annotations__ = {field: str}
+
+    return Tenant
+
+
+def test_registry_keys_by_qualified_name() -> None:
+    @jo.data(typed=True)
+    class Role:
+        title: str
+
+    assert schemas.JUST_OBJECTS.get(schemas.qualified_name(Role)) is Role
+    assert schemas.JUST_OBJECTS.get("tests.models.Role") is not Role
+    assert schemas.get_schema(Role).required == ["title"]
+    assert jo.show_schema(Actor)["definitions"]["Role"]["required"] == ["name", "race"]
+
+
+def test_registry_releases_dynamic_models() -> None:
+    tenant = make_tenant("name")
+    tenant(name="acme")
+    key = schemas.qualified_name(tenant)
+    assert key in schemas.JUST_OBJECTS
+
+    del tenant
+    gc.collect()
+    assert key not in schemas.JUST_OBJECTS
+
+
+def test_same_named_models_get_distinct_definitions() -> None:
+    @jo.data(typed=True)
+    class Role:
+        title: int
+
+    @jo.data(typed=True)
+    class Cast:
+        a: models.Role
+        b: Role
+
+    cast = Cast(a=models.Role(name="lead", race="elf"), b=Role(title=3))
+    definitions = jo.show_schema(Cast)["definitions"]
+    assert len(definitions) == 2
+    assert definitions[schemas.JUST_OBJECTS.definition_name(Role)]["required"] == ["title"]
+    assert cast.b.title == 3
+
+
+def test_models_sharing_a_qualified_name_stay_registered() -> None:
+    older, newer = make_tenant("name"), make_tenant("code")
+
+    @jo.data(typed=True)
+    class Lease:
+        tenant: older  # type: ignore
+        other: newer  # type: ignore
+
+    assert older in schemas.JUST_OBJECTS and newer in schemas.JUST_OBJECTS
+    lease = Lease(tenant=older(name="acme"), other=newer(code="x"))
+    assert set(jo.show_schema(lease)["definitions"]) == {
+        schemas.JUST_OBJECTS.definition_name(older),
+        schemas.JUST_OBJECTS.definition_name(newer),
+    }
+
+
+def test_pickle_skips_validation(monkeypatch: Any) -> None:
+    actor = Actor(name="Ann", sex="f", role=Role(name="lead", race="elf"), age=30)
+    movie = Movie(main=actor, title="Dune")
+    payload = pickle.dumps(Manager(actors=[actor], movies=[movie], personal={"ann": actor}))
+
+    def fail(*args: Any) -> None:
+        raise AssertionError("validated again")
+
+    monkeypatch.setattr(schemas, "validate", fail)
+    manager = pickle.loads(payload)
+
+    assert manager.actors == [actor]
+    assert manager.movies[0].main is manager.actors[0]
+    assert copy.deepcopy(actor) == actor
+
+
+def test_pickle_validates_untrusted_state() -> None:
+    role = Role.__new__(Role)
+    with pytest.raises(jo.ValidationException):
+        role.__setstate__({"name": "lead", "race": 1})
+    with pytest.raises(pickle.UnpicklingError):
+        role.__setstate__(("lead",))
+
+
 if __name__ == "__main__":
     schemas.show_schema(Manager)
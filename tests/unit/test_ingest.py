@@ -0,0 +1,100 @@
+import io
+from typing import Iterator, List
+
+import attr
+import pytest
+
+import justobjects as jo
+from justobjects import types
+from tests.models import Manager, Role
+
+
+@jo.data(typed=True)
+class Employee:
+    name: str
+    age: int
+    married: bool = False
+    salary: float = 0.0
+
+
+def test_iter_csv() -> None:
+    fileobj = io.StringIO("name,age,married,salary,team\nann,32,yes,1200.5,blue\nbob,41,,,red\n")
+
+    employees = list(jo.iter_csv(Employee, fileobj))
+
+    assert employees == [
+        Employee(name="ann", age=32, married=True, salary=1200.5),
+        Employee(name="bob", age=41),
+    ]
+
+
+def test_iter_csv_reports_row_errors() -> None:
+    fileobj = io.StringIO("Name\tAge\nann\tten\n\tabc\ncid\t7\n")
+
+    rows: List = list(
+        jo.iter_csv(
+            Employee, fileobj, dialect="excel-tab", header_map={"Name": "name", "Age": "age"}
+        )
+    )
+
+    assert isinstance(rows[0], jo.RowError)
+    assert rows[0].line == 2
+    assert rows[0].row == {"Name": "ann", "Age": "ten"}
+    assert rows[0].errors[0].element == "age"
+    assert rows[1].errors[0].message == "'name' is a required property"
+    assert rows[2] == Employee(name="cid", age=7)
+
+
+class PortType(types.IntegerType):
+    pass
+
+
+@jo.data()
+class Service:
+    port = attr.ib(type=int, metadata={"__jo__": PortType(minimum=1, maximum=65535)})
+    name = jo.string(required=True)
+
+
+@pytest.fixture
+def validating_converter() -> Iterator[None]:
+    types.register_converter(PortType, lambda value, schema=None: types.as_int(value, schema))
+    yield
+    del types.CONVERTERS[PortType]
+    types.register_converter(types.IntegerType, types.as_int)
+
+
+def test_iter_csv_reports_conversion_errors(validating_converter: None) -> None:
+    fileobj = io.StringIO("name,port\nweb,99999\napi,8080\n")
+
+    rows: List = list(jo.iter_csv(Service, fileobj))
+
+    assert isinstance(rows[0], jo.RowError)
+    assert [error.element for error in rows[0].errors] == ["port"]
+    assert rows[1] == Service(name="api", port=8080)
+
+
+def test_coerce() -> None:
+    employee = jo.coerce(Employee, {"name": "ann", "age": "32", "married": "yes", "page": "2"})
+
+    assert employee == Employee(name="ann", age=32, married=True)
+
+
+def test_coerce_nested() -> None:
+    actor = {"name": "ann", "sex": "f", "role": {"name": "lead", "race": "elf"}, "age": "30"}
+    movie = {"main": actor, "title": "Dune", "characters": "12"}
+    manager = jo.coerce(
+        Manager,
+        {"actors": [actor], "movies": [movie], "personal": {"ann": dict(actor, age="31")}},
+    )
+
+    assert manager.actors[0].age == 30
+    assert manager.actors[0].role == Role(name="lead", race="elf")
+    assert manager.personal["ann"].age == 31
+    assert manager.movies[0].characters == 12
+    assert manager.movies[0].main.age == 30
+
+
+def test_coerce_invalid() -> None:
+    with pytest.raises(jo.ValidationException) as v:
+        jo.coerce(Employee, {"name": "ann", "age": "ten"})
+    assert v.value.errors[0].element == "age"
@@ -0,0 +1,42 @@
+from typing import Any, Iterator, List, Tuple
+
+import pytest
+
+import justobjects as jo
+from justobjects import instrumentation
+from tests.models import Actor, Role
+
+ACTOR = {"name": "Steve", "sex": "male", "role": {"name": "Captain America", "race": "white"}}
+
+
+@pytest.fixture
+def events() -> Iterator[List[Tuple[Any, str, float]]]:
+    recorded: List[Tuple[Any, str, float]] = []
+    instrumentation.reset()
+    instrumentation.enable(lambda *event: recorded.append(event))
+    yield recorded
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_records_nothing() -> None:
+    instrumentation.reset()
+    Actor(**ACTOR).as_dict()
+    assert instrumentation.stats() == {}
+
+
+def test_phases_are_recorded(events: List[Tuple[Any, str, float]]) -> None:
+    actor = Actor(**ACTOR)
+    jo.as_dict(actor)
+    with pytest.raises(jo.ValidationException):
+        jo.validate(Role, {"name": "Nick Fury"})
+
+    stats = instrumentation.stats()
+    actor_stats = stats["tests.models.Actor"]
+    assert set(actor_stats) == {"parse", "post_init", "validate", "serialize"}
+    assert actor_stats["parse"]["count"] == 1
+    assert stats["tests.models.Role"]["parse"]["count"] == 1
+    assert actor_stats["validate"]["count"] == 1
+    assert stats["tests.models.Role"]["validate"]["count"] == 2
+    assert all(total["total"] >= 0 for total in actor_stats.values())
+    assert (Actor, "serialize") in [(model, phase) for model, phase, _ in events]
@@ -0,0 +1,38 @@
+import justobjects as jo
+from justobjects import metrics
+from tests.models import Role
+
+
+def test_histogram_counts_failures() -> None:
+    rows = [{"name": "Edgar", "race": "human"}] + [{"name": i} for i in range(10)]
+    histogram = metrics.ErrorHistogram(max_samples=2)
+
+    valid = list(histogram.filter(Role, rows))
+
+    assert valid == rows[:1]
+    summary = histogram.summary()
+    assert summary["validated"] == 11
+    assert summary["failed"] == 10
+    assert summary["dropped"] == 0
+    buckets = {(b["element"], b["keyword"]): b for b in summary["buckets"]}
+    assert set(buckets) == {("name", "type"), ("", "required")}
+    assert all(b["count"] == 10 for b in buckets.values())
+    assert buckets[("name", "type")]["model"] == "tests.models.Role"
+    assert buckets[("name", "type")]["samples"] == [
+        "0 is not of type 'string'",
+        "1 is not of type 'string'",
+    ]
+
+
+def test_histogram_is_bounded() -> None:
+    histogram = metrics.ErrorHistogram(max_buckets=1)
+    schema = jo.IntegerType(minimum=5)
+
+    assert histogram.validate(schema, 10)
+    assert not histogram.validate(schema, 1)
+    assert not histogram.validate(schema, "one")
+
+    summary = histogram.summary()
+    assert len(summary["buckets"]) == 1
+    assert summary["buckets"][0]["model"] == "IntegerType"
+    assert summary["dropped"] == 1
@@ -0,0 +1,30 @@
+import gc
+
+import justobjects as jo
+from justobjects import ingest, schemas
+
+
+@jo.data(lazy=True)
+class Warm:
+    tags = jo.array(item=str)
+    code = jo.string(pattern="^[A-Z]+$", default="A")
+
+
+def test_warmup() -> None:
+    assert schemas._state(Warm).schema is None
+
+    assert jo.warmup([Warm]) == 1
+
+    state = schemas._state(Warm)
+    assert state.schema_dict is not None
+    assert state.definition is not None
+    assert state.validator is not None
+    assert Warm in ingest._PLANS
+
+
+def test_warmup_all_and_freeze() -> None:
+    try:
+        assert jo.warmup(freeze=True) == len(schemas.JUST_OBJECTS)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
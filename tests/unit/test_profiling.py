@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import justobjects as jo
+from justobjects import profiling, validation
+from tests.models import Actor
+
+ACTOR = {"name": "Steve", "sex": "male", "role": {"name": "Captain America", "race": "white"}}
+
+
+def test_profile_attributes_keywords() -> None:
+    with profiling.profile() as prof:
+        jo.validate(Actor, ACTOR)
+        with pytest.raises(jo.ValidationException) as v:
+            jo.validate(Actor, {**ACTOR, "age": "ten"})
+
+    assert v.value.errors[0].element == "age"
+    costs = {(cost.pointer, cost.keyword): cost for cost in prof.entries()}
+    assert costs[("#", "properties")].count == 2
+    assert costs[("#/properties/age", "type")].count == 1
+    assert costs[("#/definitions/Role", "required")].count == 2
+    assert costs[("#", "properties")].total >= costs[("#", "properties")].own
+    assert "#/properties/age/type" in prof.report()
+
+
+def test_profile_type_schema() -> None:
+    with profiling.profile() as prof:
+        jo.StringType(pattern="^[a-z]+$").validate("abc")
+
+    assert {(c.pointer, c.keyword, c.count) for c in prof.entries()} == {
+        ("#", "type", 1),
+        ("#", "pattern", 1),
+    }
+    assert profiling.active() is None
+
+
+def test_profile_ignores_other_threads() -> None:
+    with profiling.profile() as prof:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(lambda _: jo.validate(Actor, ACTOR), range(4)))
+        assert profiling.active() is prof
+
+    assert prof.entries() == []
+
+
+def test_profile_with_time_budget() -> None:
+    limits = jo.Limits(timeout=60)
+    jo.validate(Actor, ACTOR, limits=limits)
+    budgeted = len(validation._BUDGETED)
+
+    with profiling.profile() as prof:
+        for _ in range(5):
+            jo.validate(Actor, ACTOR, limits=limits)
+
+    assert len(validation._BUDGETED) == budgeted
+    assert prof.entries()[0].count >= 5
@@ -1,3 +1,8 @@
+from datetime import datetime, time, timedelta, timezone
+
+import pytest
+
+from justobjects import transforms
 from tests.models import Actor, Manager, Movie, Role, RoleManager
 
 ACTOR = {
@@ -56,3 +61,27 @@ def test_with_dict() -> None:
 
     assert len(mgr.actors) == 1
     assert isinstance(mgr.actors[0], Actor)
+
+
+@pytest.mark.parametrize(
+    "raw, normalized",
+    [
+        ("2021-03-04T05:06:07Z", "2021-03-04T05:06:07+00:00"),
+        ("2021-03-04t05:06:07.5z", "2021-03-04t05:06:07.500000+00:00"),
+        ("2021-03-04T05:06:07.123456789-02:00", "2021-03-04T05:06:07.123456-02:00"),
+        ("05:06:07Z", "05:06:07+00:00"),
+    ],
+)
+def test_rfc3339_is_normalized(raw: str, normalized: str) -> None:
+    assert transforms._rfc3339(raw) == normalized
+
+
+def test_parse_rfc3339_times() -> None:
+    utc = timezone.utc
+    assert transforms.parse_datetime("2021-03-04T05:06:07.5Z") == datetime(
+        2021, 3, 4, 5, 6, 7, 500000, tzinfo=utc
+    )
+    assert transforms.parse_datetime("2021-03-04T05:06:07.123456789-02:00") == datetime(
+        2021, 3, 4, 5, 6, 7, 123456, tzinfo=timezone(timedelta(hours=-2))
+    )
+    assert transforms.parse_time("05:06:07Z") == time(5, 6, 7, tzinfo=utc)
@@ -0,0 +1,241 @@
+import pickle
+from typing import Any, Dict, List, Set
+
+import attr
+import pytest
+from jsonschema import Draft7Validator
+
+import justobjects as jo
+from justobjects import validation
+from tests.models import Manager
+
+
+def test_errors_render_element_lazily() -> None:
+    error = validation.ValidationError.from_path(
+        ("actors", 0, "age"), "'ten' is not of type 'integer'"
+    )
+
+    assert not hasattr(error, "__dict__")
+    assert error._element is None
+    assert error.element == "actors.0.age"
+    assert error.path == ("actors", 0, "age")
+    assert error == validation.ValidationError("actors.0.age", "'ten' is not of type 'integer'")
+
+
+def test_errors_are_ordered_and_frozen() -> None:
+    errors = [
+        validation.ValidationError.from_path(("b",), "late"),
+        validation.ValidationError("a", "early"),
+    ]
+
+    assert sorted(errors) == [errors[1], errors[0]]
+    assert errors[0] == validation.ValidationError("b", "late")
+    assert len({errors[0], validation.ValidationError("b", "late")}) == 1
+    assert repr(errors[0]) == "ValidationError(element='b', message='late')"
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        errors[0].message = "changed"  # type: ignore
+
+
+def test_exception_message_is_lazy() -> None:
+    with pytest.raises(jo.ValidationException) as v:
+        jo.validate(Manager, {"actors": [{"name": 1}], "movies": [], "personal": {}})
+
+    errors = v.value.errors
+    assert v.value.args == (errors,)
+    assert all(error._element is None for error in errors)
+    assert str(v.value) == f"Data validation error: {errors}"
+    assert errors[0].path[:2] == ("actors", 0)
+
+
+def test_exception_pickles() -> None:
+    exc = validation.ValidationException([validation.ValidationError.from_path(["a", 1], "bad")])
+    restored = pickle.loads(pickle.dumps(exc))
+
+    assert restored.errors == exc.errors
+    assert restored.errors[0].path == ("a", 1)
+
+
+@pytest.mark.parametrize(
+    "limits, payload, message",
+    [
+        (jo.Limits(max_depth=2), {"a": {"b": {"c": 1}}}, "maximum depth of 2"),
+        (jo.Limits(max_array_length=3), {"a": [1, 2, 3, 4]}, "maximum length of 3"),
+        (jo.Limits(max_nodes=5), {"a": list(range(10))}, "maximum of 5 values"),
+    ],
+)
+def test_limits_fail_fast(limits: jo.Limits, payload: Any, message: str) -> None:
+    with pytest.raises(jo.ValidationLimitExceeded) as v:
+        jo.validate(jo.ObjectType(), payload, limits=limits)
+    assert message in v.value.errors[0].message
+
+
+def test_time_budget() -> None:
+    schema = jo.ArrayType(items=jo.StringType(pattern="^(a+)+$"), maxItems=None)
+    with pytest.raises(jo.ValidationLimitExceeded) as v:
+        jo.validate(schema, ["a" * 20] * 100_000, limits=jo.Limits(timeout=0.01))
+    assert "exceeded 0.01s" in v.value.errors[0].message
+
+
+def test_data_object_limits() -> None:
+    @jo.data(typed=True, limits=jo.Limits(max_array_length=2))
+    class Team:
+        members: List[str]
+
+    assert Team(members=["a", "b"]).members == ["a", "b"]
+    with pytest.raises(jo.ValidationLimitExceeded):
+        Team(members=["a", "b", "c"])
+    with pytest.raises(jo.ValidationLimitExceeded):
+        jo.validate(Team, {"members": ["a", "b", "c"]})
+
+
+def test_data_object_limits_apply_to_the_whole_payload() -> None:
+    @jo.data(typed=True, limits=jo.Limits(max_nodes=6, max_depth=2))
+    class Board:
+        members: List[str]
+        guests: List[str]
+        settings: Dict[str, Dict[str, bool]] = {}
+
+    assert Board(["a", "b"], guests=["c"]).guests == ["c"]
+    with pytest.raises(jo.ValidationLimitExceeded) as v:
+        Board(members=["a", "b", "c"], guests=["d", "e", "f"])
+    assert "maximum of 6 values" in v.value.errors[0].message
+    with pytest.raises(jo.ValidationLimitExceeded) as v:
+        Board(members=[], guests=[], settings={"theme": {"dark": True}})
+    assert v.value.errors[0].element == "settings.theme"
+
+
+def test_data_object_limits_are_checked_before_conversion() -> None:
+    created: List[Any] = []
+
+    @jo.data(typed=True)
+    class Seat:
+        row: int
+
+        def __attrs_post_init__(self) -> None:
+            created.append(self)
+
+    @jo.data(typed=True, limits=jo.Limits(max_nodes=6))
+    class Venue:
+        front: List[Seat]
+        back: List[Seat]
+
+    with pytest.raises(jo.ValidationLimitExceeded):
+        Venue(front=[{"row": 1}], back=[{"row": 2}])
+    assert created == []
+
+
+def test_data_object_time_budget() -> None:
+    @jo.data(typed=True, limits=jo.Limits(timeout=0))
+    class Batch:
+        values: List[int]
+
+    with pytest.raises(jo.ValidationLimitExceeded) as v:
+        Batch(values=list(range(5000)))
+    assert "exceeded 0s" in v.value.errors[0].message
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [1, 2, 3],
+        [1, 1.0],
+        [True, 1],
+        [False, 0, None],
+        [True, True],
+        ["1", 1],
+        [[1, 2], [1, 2]],
+        [[1, True], [1, 1]],
+        [{"a": 1, "b": [1]}, {"b": [1], "a": 1}],
+        [{"a": 1}, {"a": True}],
+        [{"a": {"b": 1}}, {"a": {"b": 2}}],
+        [{1, 2}, {1, 2}],
+    ],
+)
+def test_unique_items_matches_jsonschema(items: List[Any]) -> None:
+    schema = {"type": "array", "uniqueItems": True}
+    expected = [e.message for e in Draft7Validator(schema).iter_errors(items)]
+    actual = [e.message for e in validation.create_validator(schema).iter_errors(items)]
+    assert actual == expected
+
+
+def test_set_field_uniqueness() -> None:
+    with pytest.raises(jo.ValidationException) as v:
+        validation.validate(jo.show_schema(Set[str]), ["a", "b", "a"])
+    assert v.value.errors[0].message == "['a', 'b', 'a'] has non-unique elements"
+
+
+@pytest.mark.parametrize(
+    "items, instance",
+    [
+        ({"type": "integer", "minimum": 0}, [1, 2.0, -1, True, "3", 2**70]),
+        ({"type": "number", "exclusiveMaximum": 10}, [1, 2.5, 10, False, None]),
+        ({"type": "string", "maxLength": 3, "pattern": "^a"}, ["ab", "abcd", "ba", 1]),
+        ({"type": "string", "enum": ["x", "y"]}, ["x", "z", "y"]),
+        ({"type": "boolean"}, [True, False, 0, 1]),
+        ({"type": "string", "format": "email"}, ["a@b.com", "nope"]),
+        ({"type": "integer"}, "not an array"),
+        ({"type": "integer", "minLength": 2, "pattern": "^1"}, [1, 2, "3"]),
+        ({"type": "string", "minimum": 2, "maxLength": 2}, ["a", "abc", 3]),
+        ({"type": "boolean", "maximum": 0, "maxLength": 1}, [True, 1]),
+    ],
+)
+def test_scalar_items_match_jsonschema(items: Any, instance: Any) -> None:
+    schema = {"type": "array", "items": items}
+    expected = [(list(e.path), e.message) for e in Draft7Validator(schema).iter_errors(instance)]
+    actual = [
+        (list(e.path), e.message)
+        for e in validation.JustObjectsValidator(schema).iter_errors(instance)
+    ]
+    assert actual == expected
+
+
+class CountingBackend(validation.Backend):
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.compiled = 0
+
+    def compile(self, schema: Dict[str, Any]) -> validation.Validator:
+        self.compiled += 1
+        return Draft7Validator(schema)
+
+
+def test_model_backend() -> None:
+    backend = CountingBackend()
+    validation.register_backend(backend)
+
+    @jo.data(typed=True, backend="counting")
+    class Counted:
+        age: int
+
+    Counted(age=1)
+    with pytest.raises(jo.ValidationException) as v:
+        Counted(age="one")  # type: ignore
+    assert backend.compiled == 1
+    assert v.value.errors == [jo.ValidationError("age", "'one' is not of type 'integer'")]
+
+
+def test_global_backend() -> None:
+    backend = CountingBackend()
+    validation.register_backend(backend)
+    validation.use_backend("counting")
+    try:
+        with pytest.raises(jo.ValidationException):
+            validation.validate({"type": "string"}, 1)
+    finally:
+        validation.use_backend("jsonschema")
+    assert backend.compiled == 1
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        jo.data(backend="missing")
+
+
+def test_backend_must_compile() -> None:
+    class Incomplete(validation.Backend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        validation.register_backend(Incomplete())  # type: ignore
+    assert "incomplete" not in validation.BACKENDS
@@ -1,5 +1,7 @@
+import datetime
 from typing import Any, Union
 
+import attr
 import pytest
 
 from justobjects import types, validation
@@ -112,3 +114,93 @@ def test_cast_string(value: Any, expectation: bool) -> None:
 def test_cast_uuid(value: Any, expectation: str) -> None:
     nt = types.UuidType()
     assert nt.coerce(value) == expectation
+
+
+def test_coercer_is_reused() -> None:
+    it = types.IntegerType(minimum=1)
+    compiled = types.coercer(it)
+
+    assert types.coercer(it) is compiled
+    assert types.cast("12", it) == 12
+    assert types.as_array(["1", "2"], types.ArrayType(items=it)) == [1, 2]
+    with pytest.raises(validation.ValidationException) as v:
+        it.coerce("-3")
+    assert v.value.errors[0].message == "-3 is less than the minimum of 1"
+
+
+def test_cast_unknown_schema() -> None:
+    with pytest.raises(ValueError):
+        types.cast({}, types.ObjectType())
+
+
+@pytest.mark.parametrize(
+    "schema, value, expectation",
+    [
+        (types.Ipv4Type(), b"10.0.0.1", "10.0.0.1"),
+        (types.Ipv6Type(), "::1", "::1"),
+        (types.UriType(), "https://justobjects.io", "https://justobjects.io"),
+    ],
+)
+def test_cast_string_subtypes(schema: types.JustSchema, value: Any, expectation: str) -> None:
+    assert types.cast(value, schema) == expectation
+
+
+@attr.s(auto_attribs=True)
+class PortType(types.IntegerType):
+    minimum: int = 1
+    maximum: int = 65535
+
+
+def test_register_converter() -> None:
+    assert types.cast("8080", PortType()) == 8080
+
+    types.register_converter(PortType, lambda value, schema=None: int(value) + 1)
+    try:
+        assert types.cast("8080", PortType()) == 8081
+    finally:
+        del types.CONVERTERS[PortType]
+        types.register_converter(types.IntegerType, types.as_int)
+
+
+@pytest.mark.parametrize(
+    "schema, value, expectation",
+    [
+        (types.DateTimeType(), "2021-06-01T10:30:00", datetime.datetime(2021, 6, 1, 10, 30)),
+        (types.DateTimeType(), b"2021-06-01T10:30:00", datetime.datetime(2021, 6, 1, 10, 30)),
+        (types.DateTimeType(), datetime.datetime(2021, 6, 1), datetime.datetime(2021, 6, 1)),
+        (types.DateTimeType(), datetime.date(2021, 6, 1), datetime.datetime(2021, 6, 1)),
+        (types.DateType(), "2021-06-01", datetime.date(2021, 6, 1)),
+        (types.DateType(), datetime.datetime(2021, 6, 1, 10), datetime.date(2021, 6, 1)),
+        (types.TimeType(), "10:30:15", datetime.time(10, 30, 15)),
+        (types.TimeType(), datetime.time(10, 30), datetime.time(10, 30)),
+    ],
+)
+def test_cast_dates(schema: types.JustSchema, value: Any, expectation: Any) -> None:
+    assert types.cast(value, schema) == expectation
+
+
+@pytest.mark.parametrize(
+    "schema, value",
+    [
+        (types.DateTimeType(), "2021-13-01T10:30"),
+        (types.DateType(), "June"),
+        (types.TimeType(), 10),
+    ],
+)
+def test_cast_dates_invalids(schema: types.JustSchema, value: Any) -> None:
+    with pytest.raises(validation.ValidationException):
+        schema.coerce(value)
+
+
+def test_coercer_follows_schema_changes() -> None:
+    it = types.IntegerType()
+    array = types.ArrayType(items=types.IntegerType())
+    assert types.cast("5", it) == 5
+    assert types.as_array(["5"], array) == [5]
+
+    it.minimum = 10
+    array.items.maximum = 1
+    with pytest.raises(validation.ValidationException):
+        types.cast("5", it)
+    with pytest.raises(validation.ValidationException):
+        types.as_array(["5"], array)